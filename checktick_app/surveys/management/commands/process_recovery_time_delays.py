@@ -20,6 +20,14 @@ from django.utils import timezone
 
 from checktick_app.surveys.models import RecoveryRequest
 
+try:
+    from checktick_app.surveys.notifications import (
+        send_recovery_ready_for_execution_notification,
+    )
+except ImportError:
+    # Notification function doesn't exist yet
+    send_recovery_ready_for_execution_notification = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -55,12 +63,14 @@ class Command(BaseCommand):
             )
 
         # Find all requests in time delay that have expired
-        expired_requests = RecoveryRequest.objects.filter(
-            status=RecoveryRequest.Status.IN_TIME_DELAY,
-            time_delay_until__lte=timezone.now(),
+        expired_requests = list(
+            RecoveryRequest.objects.filter(
+                status=RecoveryRequest.Status.IN_TIME_DELAY,
+                time_delay_until__lte=timezone.now(),
+            ).select_related("user", "survey")
         )
 
-        count = expired_requests.count()
+        count = len(expired_requests)
 
         if count == 0:
             if verbose:
@@ -75,59 +85,63 @@ class Command(BaseCommand):
         processed = 0
         errors = 0
 
+        if dry_run:
+            completed_ids = {request.pk for request in expired_requests}
+        else:
+            # Update statuses and write audit entries for the whole batch in
+            # one transaction; if it fails, no request in the batch changes
+            try:
+                completed = RecoveryRequest.complete_expired_time_delays(
+                    expired_requests
+                )
+            except Exception as e:
+                logger.exception("Error processing recovery requests: %s", e)
+                self.stdout.write(
+                    self.style.ERROR(f"    ✗ Error processing recovery requests: {e}")
+                )
+                errors = count
+                expired_requests = []
+                completed = []
+            completed_ids = {request.pk for request in completed}
+
+        # Resolve output helpers once instead of on every iteration
+        write = self.stdout.write
+        ok, warn, err = self.style.SUCCESS, self.style.WARNING, self.style.ERROR
+
         for request in expired_requests:
             try:
                 if verbose:
-                    self.stdout.write(
+                    write(
                         f"  Processing: {request.request_code} "
                         f"(User: {request.user.email}, Survey: {request.survey.name})"
                     )
-                    self.stdout.write(
-                        f"    Time delay expired: {request.time_delay_until}"
-                    )
+                    write(f"    Time delay expired: {request.time_delay_until}")
+
+                if request.pk not in completed_ids:
+                    # This shouldn't happen given our query, but log it
+                    write(warn("    ⚠ Time delay not complete (unexpected)"))
+                    continue
+
+                processed += 1
 
                 if not dry_run:
-                    # Use the model's method which handles status update and audit entry
-                    completed = request.check_time_delay_complete()
-
-                    if completed:
-                        processed += 1
-
-                        # Send notification email
-                        self._send_ready_notification(request, verbose)
-
-                        if verbose:
-                            self.stdout.write(
-                                self.style.SUCCESS(
-                                    "    ✓ Status updated to READY_FOR_EXECUTION"
-                                )
-                            )
-                    else:
-                        # This shouldn't happen given our query, but log it
-                        self.stdout.write(
-                            self.style.WARNING(
-                                "    ⚠ Time delay not complete (unexpected)"
-                            )
-                        )
-                else:
-                    processed += 1
+                    # Send notification email
+                    self._send_ready_notification(request, verbose)
+
                     if verbose:
-                        self.stdout.write(
-                            self.style.SUCCESS(
-                                "    [DRY RUN] Would update to READY_FOR_EXECUTION"
-                            )
-                        )
+                        write(ok("    ✓ Status updated to READY_FOR_EXECUTION"))
+                elif verbose:
+                    write(ok("    [DRY RUN] Would update to READY_FOR_EXECUTION"))
 
             except Exception as e:
                 errors += 1
                 logger.exception(
-                    f"Error processing recovery request {request.request_code}: {e}"
-                )
-                self.stdout.write(
-                    self.style.ERROR(
-                        f"    ✗ Error processing {request.request_code}: {e}"
-                    )
+                    "Error processing recovery request %s: %s",
+                    request.request_code,
+                    e,
+                    extra={"request_code": request.request_code},
                 )
+                write(err(f"    ✗ Error processing {request.request_code}: {e}"))
 
         # Summary
         action = "Would process" if dry_run else "Processed"
@@ -147,11 +161,14 @@ class Command(BaseCommand):
 
     def _send_ready_notification(self, request: RecoveryRequest, verbose: bool):
         """Send notification that recovery is ready for execution."""
-        try:
-            from checktick_app.surveys.notifications import (
-                send_recovery_ready_for_execution_notification,
-            )
+        if send_recovery_ready_for_execution_notification is None:
+            if verbose:
+                self.stdout.write(
+                    self.style.WARNING("    ⚠ Notification function not available")
+                )
+            return
 
+        try:
             send_recovery_ready_for_execution_notification(request)
 
             if verbose:
@@ -159,15 +176,12 @@ class Command(BaseCommand):
                     self.style.SUCCESS("    ✓ Sent ready-for-execution notification")
                 )
 
-        except ImportError:
-            # Notification function doesn't exist yet
-            if verbose:
-                self.stdout.write(
-                    self.style.WARNING("    ⚠ Notification function not available")
-                )
         except Exception as e:
             logger.warning(
-                f"Failed to send ready notification for {request.request_code}: {e}"
+                "Failed to send ready notification for %s: %s",
+                request.request_code,
+                e,
+                extra={"request_code": request.request_code},
             )
             if verbose:
                 self.stdout.write(
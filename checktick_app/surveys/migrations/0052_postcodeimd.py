@@ -0,0 +1,45 @@
+# Generated by Django 5.2.16 on 2026-10-15 22:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        (
+            "surveys",
+            "0051_dataset_team_dataset_surveys_dat_team_id_617829_idx_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PostcodeIMD",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("postcode", models.CharField(max_length=10)),
+                ("quantile", models.PositiveSmallIntegerField(default=10)),
+                ("imd_decile", models.PositiveSmallIntegerField()),
+                ("imd_rank", models.PositiveIntegerField(blank=True, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Postcode IMD",
+                "verbose_name_plural": "Postcode IMD",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("postcode", "quantile"),
+                        name="unique_postcode_imd_per_quantile",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -7,7 +7,7 @@ import uuid
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
 from django.db.models import Q
 from django.utils import timezone
 
@@ -4735,6 +4735,65 @@ class RecoveryRequest(models.Model):
 
         return False
 
+    @classmethod
+    def complete_expired_time_delays(
+        cls, requests: list[RecoveryRequest]
+    ) -> list[RecoveryRequest]:
+        """
+        Bulk equivalent of check_time_delay_complete().
+
+        Moves every request whose time delay has passed to READY_FOR_EXECUTION
+        with a single UPDATE and writes their audit entries with a single
+        INSERT, all in one transaction. Requests changed concurrently by
+        another process are skipped.
+
+        Returns the requests that were moved to READY_FOR_EXECUTION.
+        """
+        now = timezone.now()
+        due = [
+            request
+            for request in requests
+            if request.status == cls.Status.IN_TIME_DELAY
+            and request.time_delay_until
+            and now >= request.time_delay_until
+        ]
+        if not due:
+            return []
+
+        with transaction.atomic():
+            locked = set(
+                cls.objects.select_for_update()
+                .filter(
+                    pk__in=[request.pk for request in due],
+                    status=cls.Status.IN_TIME_DELAY,
+                )
+                .values_list("pk", flat=True)
+            )
+            due = [request for request in due if request.pk in locked]
+            if not due:
+                return []
+
+            cls.objects.filter(pk__in=locked).update(
+                status=cls.Status.READY_FOR_EXECUTION
+            )
+
+            entries = []
+            for request in due:
+                request.status = cls.Status.READY_FOR_EXECUTION
+                entry = RecoveryAuditEntry(
+                    recovery_request=request,
+                    event_type="time_delay_complete",
+                    severity=RecoveryAuditEntry.Severity.INFO,
+                    actor_type="system",
+                    details={"time_delay_hours": request.time_delay_hours},
+                )
+                # bulk_create() bypasses save(), so hash the entry here
+                entry._generate_hash()
+                entries.append(entry)
+            RecoveryAuditEntry.objects.bulk_create(entries)
+
+        return due
+
     def execute_recovery(
         self,
         admin: User,
@@ -5411,3 +5470,34 @@ class UserSurveyKEKEscrow(models.Model):
         self.last_recovered_at = timezone.now()
         self.last_recovered_by = admin
         self.save()
+
+
+class PostcodeIMD(models.Model):
+    """
+    Locally stored IMD (Index of Multiple Deprivation) lookup result.
+
+    IMDService checks this table before calling the RCPCH Deprivation API and
+    records every successful API lookup here, so each postcode only needs to
+    be fetched once per IMD dataset release.
+    """
+
+    # Normalized postcode (no spaces, uppercase), e.g. "SW1A1AA"
+    postcode = models.CharField(max_length=10)
+    # Number of quantiles the value was requested for (10 = deciles)
+    quantile = models.PositiveSmallIntegerField(default=10)
+    imd_decile = models.PositiveSmallIntegerField()
+    imd_rank = models.PositiveIntegerField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["postcode", "quantile"],
+                name="unique_postcode_imd_per_quantile",
+            ),
+        ]
+        verbose_name = "Postcode IMD"
+        verbose_name_plural = "Postcode IMD"
+
+    def __str__(self) -> str:
+        return f"{self.postcode} (quantile {self.quantile}): {self.imd_decile}"
@@ -21,12 +21,24 @@ IMD data is returned as a quantile (decile by default), where:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+import functools
 import logging
+import string
 from typing import TYPE_CHECKING
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
+from django.core.cache import cache
+from django.core.signals import setting_changed
+from django.db import DatabaseError, transaction
+from django.dispatch import receiver
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ..models import PostcodeIMD
 
 if TYPE_CHECKING:
     pass
@@ -34,7 +46,77 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@functools.cache
+def _get_api_config() -> tuple[str | None, str | None]:
+    """Return the (IMD_API_URL, IMD_API_KEY) pair, read once per process."""
+    return (
+        getattr(settings, "IMD_API_URL", None),
+        getattr(settings, "IMD_API_KEY", None),
+    )
+
+
+@receiver(setting_changed)
+def _reset_api_config(*, setting, **kwargs):
+    """Re-read the API configuration when settings are overridden (tests)."""
+    if setting in ("IMD_API_URL", "IMD_API_KEY"):
+        _get_api_config.cache_clear()
+
+
+# Translation table that deletes whitespace and uppercases ASCII letters, so a
+# postcode is normalized in a single pass (UK postcodes are ASCII)
+_POSTCODE_TABLE = str.maketrans(
+    string.ascii_lowercase, string.ascii_uppercase, " \t\n\r"
+)
+
+
+def _normalize_postcode(postcode: str) -> str:
+    """Normalize a postcode for the API (remove whitespace, uppercase)."""
+    return postcode.translate(_POSTCODE_TABLE)
+
+
+# Longest normalized postcode the PostcodeIMD table can hold
+_POSTCODE_MAX_LENGTH = PostcodeIMD._meta.get_field("postcode").max_length
+
+
+def _cache_key(clean_postcode: str, quantile: int) -> str:
+    return f"imd:{clean_postcode}:{quantile}"
+
+
+def _build_session() -> requests.Session:
+    """
+    Build a pooled HTTP session for IMD API calls.
+
+    Reusing a session keeps connections alive between lookups, so batches of
+    postcodes pay the TCP/TLS handshake once rather than per request. Transient
+    gateway errors are retried with a short backoff; if retries are exhausted
+    the final response is returned so it is reported like any other API error.
+
+    Read timeouts are never retried, so a slow API is reported as
+    "API timeout" after a single attempt. A failed connection is retried once.
+    A lookup makes at most three attempts in all, each bounded by the request
+    timeout, plus 0.4s of backoff (Retry-After headers are ignored). With
+    IMDService.DEFAULT_TIMEOUT that is roughly 15s in the worst case.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=2,
+            connect=1,
+            read=0,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=["GET"],
+            raise_on_status=False,
+            respect_retry_after_header=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@dataclass(slots=True, frozen=True)
 class IMDResult:
     """Result from an IMD lookup."""
 
@@ -49,11 +131,19 @@ class IMDResult:
         return self.error is None and self.imd_decile is not None
 
 
+# Results are frozen, so the one for an empty postcode can be shared
+_EMPTY_POSTCODE_RESULT = IMDResult(
+    postcode="", imd_decile=None, imd_rank=None, error="Empty postcode"
+)
+
+
 class IMDService:
     """
     Service for looking up Index of Multiple Deprivation data.
 
     Uses the RCPCH Deprivation API to look up IMD quantile from postcodes.
+    Successful lookups are saved to the PostcodeIMD table (and the cache), so
+    each postcode is only fetched from the API once.
 
     Configuration:
         - IMD_API_URL: Base URL for the IMD API
@@ -80,11 +170,20 @@ class IMDService:
     # Default quantile (10 = deciles)
     DEFAULT_QUANTILE = 10
 
+    # Successful lookups are cached for 30 days; IMD data only changes
+    # between dataset releases
+    CACHE_TIMEOUT = 60 * 60 * 24 * 30
+
+    # Maximum concurrent API requests made by lookup_imd_bulk
+    BULK_MAX_WORKERS = 16
+
+    # Shared connection pool for all lookups in this process
+    _session = _build_session()
+
     @classmethod
     def is_configured(cls) -> bool:
         """Check if the IMD API is configured."""
-        api_url = getattr(settings, "IMD_API_URL", None)
-        api_key = getattr(settings, "IMD_API_KEY", None)
+        api_url, api_key = _get_api_config()
         return bool(api_url and api_key)
 
     @classmethod
@@ -110,20 +209,47 @@ class IMDService:
             if result.is_valid:
                 print(f"IMD Decile: {result.imd_decile}")
         """
-        # Normalize postcode (remove spaces, uppercase)
-        clean_postcode = postcode.replace(" ", "").strip().upper()
+        clean_postcode = _normalize_postcode(postcode)
+
+        if clean_postcode and cls.is_configured():
+            stored = cls._get_stored([clean_postcode], quantile)
+            if clean_postcode in stored:
+                imd_decile, imd_rank = stored[clean_postcode]
+                return IMDResult(
+                    postcode=postcode,
+                    imd_decile=imd_decile,
+                    imd_rank=imd_rank,
+                )
+
+        result = cls._fetch_imd(postcode, quantile=quantile, timeout=timeout)
+        if result.is_valid:
+            cls._store({clean_postcode: result}, quantile)
+        return result
+
+    @classmethod
+    def _fetch_imd(
+        cls,
+        postcode: str,
+        quantile: int = DEFAULT_QUANTILE,
+        timeout: int = DEFAULT_TIMEOUT,
+    ) -> IMDResult:
+        """
+        Look up IMD data for a postcode from the API.
+
+        Does not read or write the cache or database, so it is safe to call
+        from worker threads.
+        """
+        clean_postcode = _normalize_postcode(postcode)
 
         if not clean_postcode:
-            return IMDResult(
-                postcode=postcode,
-                imd_decile=None,
-                imd_rank=None,
-                error="Empty postcode",
-            )
+            # Results echo the caller's postcode, so only "" can share the
+            # prebuilt result
+            if not postcode:
+                return _EMPTY_POSTCODE_RESULT
+            return replace(_EMPTY_POSTCODE_RESULT, postcode=postcode)
 
         # Check API configuration
-        api_url = getattr(settings, "IMD_API_URL", None)
-        api_key = getattr(settings, "IMD_API_KEY", None)
+        api_url, api_key = _get_api_config()
 
         if not api_url or not api_key:
             logger.warning("IMD API not configured")
@@ -137,7 +263,7 @@ class IMDService:
         try:
             # Build request URL
             # API expects: ?postcode={postcode}&quantile={quantile}
-            response = requests.get(
+            response = cls._session.get(
                 api_url,
                 params={
                     "postcode": clean_postcode,
@@ -147,24 +273,36 @@ class IMDService:
                     "Ocp-Apim-Subscription-Key": api_key,
                 },
                 timeout=timeout,
+                # Defer downloading the body until we know we want it
+                stream=True,
             )
 
             if response.status_code == 200:
                 data = response.json()
                 # Extract IMD data from response
                 # The API returns different field names depending on quantile
-                imd_decile = data.get("imd_decile") or data.get("quantile")
-                imd_rank = data.get("imd_rank") or data.get("rank")
+                # Only fall back when a field is missing or null, so falsy
+                # values such as 0 are kept
+                imd_decile = data.get("imd_decile")
+                if imd_decile is None:
+                    imd_decile = data.get("quantile")
+                imd_rank = data.get("imd_rank")
+                if imd_rank is None:
+                    imd_rank = data.get("rank")
 
                 if imd_decile is not None:
+                    imd_decile = int(imd_decile)
+                    imd_rank = int(imd_rank) if imd_rank is not None else None
                     return IMDResult(
                         postcode=postcode,
-                        imd_decile=int(imd_decile),
-                        imd_rank=int(imd_rank) if imd_rank is not None else None,
+                        imd_decile=imd_decile,
+                        imd_rank=imd_rank,
                     )
                 else:
                     logger.warning(
-                        f"IMD API returned no decile for postcode {clean_postcode}: {data}"
+                        "IMD API returned no decile for postcode %s: %s",
+                        clean_postcode,
+                        data,
                     )
                     return IMDResult(
                         postcode=postcode,
@@ -174,7 +312,9 @@ class IMDService:
                     )
 
             elif response.status_code == 404:
-                logger.info(f"Postcode not found in IMD data: {clean_postcode}")
+                # Error pages are never parsed; release them without reading
+                response.close()
+                logger.info("Postcode not found in IMD data: %s", clean_postcode)
                 return IMDResult(
                     postcode=postcode,
                     imd_decile=None,
@@ -183,9 +323,11 @@ class IMDService:
                 )
 
             else:
+                response.close()
                 logger.error(
-                    f"IMD API error: status={response.status_code}, "
-                    f"postcode={clean_postcode}"
+                    "IMD API error: status=%s, postcode=%s",
+                    response.status_code,
+                    clean_postcode,
                 )
                 return IMDResult(
                     postcode=postcode,
@@ -195,7 +337,7 @@ class IMDService:
                 )
 
         except requests.Timeout:
-            logger.error(f"IMD API timeout for postcode: {clean_postcode}")
+            logger.error("IMD API timeout for postcode: %s", clean_postcode)
             return IMDResult(
                 postcode=postcode,
                 imd_decile=None,
@@ -203,8 +345,18 @@ class IMDService:
                 error="API timeout",
             )
 
+        except requests.JSONDecodeError as e:
+            # Also a RequestException; report it as a parsing error instead
+            logger.error("IMD API response parsing error: %s", e)
+            return IMDResult(
+                postcode=postcode,
+                imd_decile=None,
+                imd_rank=None,
+                error=f"Invalid API response: {str(e)}",
+            )
+
         except requests.RequestException as e:
-            logger.error(f"IMD API request error: {e}")
+            logger.error("IMD API request error: %s", e)
             return IMDResult(
                 postcode=postcode,
                 imd_decile=None,
@@ -213,10 +365,189 @@ class IMDService:
             )
 
         except (ValueError, KeyError) as e:
-            logger.error(f"IMD API response parsing error: {e}")
+            logger.error("IMD API response parsing error: %s", e)
             return IMDResult(
                 postcode=postcode,
                 imd_decile=None,
                 imd_rank=None,
                 error=f"Invalid API response: {str(e)}",
             )
+
+    @classmethod
+    def lookup_imd_bulk(
+        cls,
+        postcodes: list[str],
+        quantile: int = DEFAULT_QUANTILE,
+        timeout: int = DEFAULT_TIMEOUT,
+    ) -> list[IMDResult]:
+        """
+        Look up IMD data for many postcodes concurrently.
+
+        Postcodes are de-duplicated after normalization and stored results
+        are fetched in a single query. Each remaining postcode is requested
+        once, with up to BULK_MAX_WORKERS API calls running in parallel over
+        the shared session.
+
+        Args:
+            postcodes: UK postcodes (with or without spaces)
+            quantile: Number of quantiles (default 10 for deciles)
+            timeout: Request timeout in seconds
+
+        Returns:
+            One IMDResult per input postcode, in the same order
+        """
+        unique: dict[str, str] = {}
+        for postcode in postcodes:
+            unique.setdefault(_normalize_postcode(postcode), postcode)
+
+        if not unique:
+            return []
+
+        results: dict[str, IMDResult] = {}
+        if cls.is_configured():
+            stored = cls._get_stored([pc for pc in unique if pc], quantile)
+            for clean_postcode, (imd_decile, imd_rank) in stored.items():
+                results[clean_postcode] = IMDResult(
+                    postcode=unique[clean_postcode],
+                    imd_decile=imd_decile,
+                    imd_rank=imd_rank,
+                )
+
+        pending = {pc: postcode for pc, postcode in unique.items() if pc not in results}
+        if pending:
+
+            def fetch(postcode: str) -> IMDResult:
+                return cls._fetch_imd(postcode, quantile=quantile, timeout=timeout)
+
+            with ThreadPoolExecutor(
+                max_workers=min(cls.BULK_MAX_WORKERS, len(pending))
+            ) as executor:
+                fetched = dict(zip(pending, executor.map(fetch, pending.values())))
+
+            cls._store(
+                {pc: result for pc, result in fetched.items() if result.is_valid},
+                quantile,
+            )
+            results.update(fetched)
+
+        return [
+            replace(results[_normalize_postcode(postcode)], postcode=postcode)
+            for postcode in postcodes
+        ]
+
+    @classmethod
+    async def lookup_imd_async(
+        cls,
+        postcode: str,
+        quantile: int = DEFAULT_QUANTILE,
+        timeout: int = DEFAULT_TIMEOUT,
+    ) -> IMDResult:
+        """
+        Async variant of lookup_imd for use from async views.
+
+        The API call runs in a worker thread, so several lookups can be
+        awaited together (e.g. with asyncio.gather) without blocking the event
+        loop. Cache and database access stay on Django's thread-sensitive
+        executor. The pooled session is shared with lookup_imd.
+        """
+        clean_postcode = _normalize_postcode(postcode)
+
+        if clean_postcode and cls.is_configured():
+            stored = await sync_to_async(cls._get_stored)([clean_postcode], quantile)
+            if clean_postcode in stored:
+                imd_decile, imd_rank = stored[clean_postcode]
+                return IMDResult(
+                    postcode=postcode,
+                    imd_decile=imd_decile,
+                    imd_rank=imd_rank,
+                )
+
+        result = await sync_to_async(cls._fetch_imd, thread_sensitive=False)(
+            postcode, quantile=quantile, timeout=timeout
+        )
+        if result.is_valid:
+            await sync_to_async(cls._store)({clean_postcode: result}, quantile)
+        return result
+
+    @classmethod
+    def _get_stored(
+        cls, clean_postcodes: list[str], quantile: int
+    ) -> dict[str, tuple[int, int | None]]:
+        """
+        Return stored (imd_decile, imd_rank) pairs keyed by normalized postcode.
+
+        Checks the cache first, then the PostcodeIMD table for anything not
+        cached. Database hits are copied back into the cache.
+        """
+        keys = {_cache_key(pc, quantile): pc for pc in clean_postcodes}
+        stored = {keys[key]: value for key, value in cache.get_many(keys).items()}
+
+        missing = [pc for pc in clean_postcodes if pc not in stored]
+        if missing:
+            try:
+                # A savepoint, so a failed read doesn't break the caller's
+                # transaction on PostgreSQL
+                with transaction.atomic():
+                    from_db = {
+                        pc: (imd_decile, imd_rank)
+                        for pc, imd_decile, imd_rank in PostcodeIMD.objects.filter(
+                            quantile=quantile, postcode__in=missing
+                        ).values_list("postcode", "imd_decile", "imd_rank")
+                    }
+            except DatabaseError as e:
+                logger.warning("Could not read stored IMD lookups: %s", e)
+                return stored
+            if from_db:
+                cache.set_many(
+                    {_cache_key(pc, quantile): value for pc, value in from_db.items()},
+                    cls.CACHE_TIMEOUT,
+                )
+                stored.update(from_db)
+
+        return stored
+
+    @classmethod
+    def _store(cls, results: dict[str, IMDResult], quantile: int) -> None:
+        """
+        Save successful lookups, keyed by normalized postcode, for reuse.
+
+        Storing is only a shortcut for later lookups: postcodes too long for
+        the table are skipped, and a database error is logged rather than
+        raised, so the caller still gets its results.
+        """
+        results = {
+            pc: result
+            for pc, result in results.items()
+            if len(pc) <= _POSTCODE_MAX_LENGTH
+        }
+        if not results:
+            return
+
+        try:
+            # A savepoint, so a failed write doesn't break the caller's
+            # transaction on PostgreSQL
+            with transaction.atomic():
+                PostcodeIMD.objects.bulk_create(
+                    [
+                        PostcodeIMD(
+                            postcode=pc,
+                            quantile=quantile,
+                            imd_decile=result.imd_decile,
+                            imd_rank=result.imd_rank,
+                        )
+                        for pc, result in results.items()
+                    ],
+                    update_conflicts=True,
+                    unique_fields=["postcode", "quantile"],
+                    update_fields=["imd_decile", "imd_rank", "updated_at"],
+                )
+        except DatabaseError as e:
+            logger.warning("Could not store IMD lookups: %s", e)
+            return
+        cache.set_many(
+            {
+                _cache_key(pc, quantile): (result.imd_decile, result.imd_rank)
+                for pc, result in results.items()
+            },
+            cls.CACHE_TIMEOUT,
+        )
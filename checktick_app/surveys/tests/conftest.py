@@ -0,0 +1,147 @@
+"""
+Shared fixtures for the surveys test package.
+
+The base graph (users, an organization with an admin, and a standalone team)
+is built once per test module, inside a transaction that stays open for the
+module and is rolled back at the end. It is module-scoped rather than
+session-scoped so transactional tests elsewhere never see its rows.
+"""
+
+from types import SimpleNamespace
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.test import override_settings
+import pytest
+
+from checktick_app.core.models import UserProfile
+from checktick_app.surveys.models import (
+    Organization,
+    OrganizationMembership,
+    Team,
+)
+
+User = get_user_model()
+TEST_PASSWORD = "x"
+
+
+@pytest.fixture(scope="module")
+def fast_password_hasher():
+    """Hash fixture passwords with MD5; the default hasher is deliberately slow."""
+    with override_settings(
+        PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"]
+    ):
+        yield
+
+
+@pytest.fixture(scope="module")
+def module_db(django_db_setup, django_db_blocker):
+    """
+    Keep a transaction open for the whole module (like TestCase.setUpTestData).
+
+    Module-scoped fixtures create their rows once inside it; each test still
+    runs in its own savepoint, and everything is rolled back after the module.
+    """
+    with django_db_blocker.unblock():
+        atomic = transaction.atomic()
+        atomic.__enter__()
+    yield
+    with django_db_blocker.unblock():
+        transaction.set_rollback(True)
+        atomic.__exit__(None, None, None)
+
+
+@pytest.fixture(scope="module")
+def graph(module_db, fast_password_hasher, django_db_blocker):
+    """
+    The users, organization and team shared by the tests in a module.
+
+    Users and their profiles are inserted with one bulk_create() each. That
+    skips save() and the post_save signals, so the password is hashed once
+    and shared, and the profiles the signals would create are added directly.
+    """
+    password = make_password(TEST_PASSWORD)
+    with django_db_blocker.unblock():
+        regular_user, org_owner, org_admin, team_owner = User.objects.bulk_create(
+            [
+                User(username=username, email=email, password=password)
+                for username, email in [
+                    ("regularuser", "regular@example.com"),
+                    ("orgowner", "orgowner@example.com"),
+                    ("orgadmin", "orgadmin@example.com"),
+                    ("teamowner", "teamowner@example.com"),
+                ]
+            ]
+        )
+        UserProfile.objects.bulk_create(
+            [
+                UserProfile(user=user, email_confirmed=True)
+                for user in (regular_user, org_owner, org_admin, team_owner)
+            ]
+        )
+        organization = Organization.objects.create(
+            name="Test Organization",
+            owner=org_owner,
+        )
+        org_admin_membership = OrganizationMembership.objects.create(
+            organization=organization,
+            user=org_admin,
+            role=OrganizationMembership.Role.ADMIN,
+        )
+        standalone_team = Team.objects.create(
+            name="Standalone Team",
+            owner=team_owner,
+        )
+
+    return SimpleNamespace(
+        regular_user=regular_user,
+        org_owner=org_owner,
+        org_admin=org_admin,
+        team_owner=team_owner,
+        organization=organization,
+        org_admin_membership=org_admin_membership,
+        standalone_team=standalone_team,
+    )
+
+
+@pytest.fixture(scope="module")
+def regular_user(graph):
+    """A regular authenticated user."""
+    return graph.regular_user
+
+
+@pytest.fixture(scope="module")
+def org_owner(graph):
+    """An organization owner."""
+    return graph.org_owner
+
+
+@pytest.fixture(scope="module")
+def org_admin(graph):
+    """An organization admin (not owner)."""
+    return graph.org_admin
+
+
+@pytest.fixture(scope="module")
+def team_owner(graph):
+    """A team owner."""
+    return graph.team_owner
+
+
+@pytest.fixture(scope="module")
+def organization(graph):
+    """An organization for testing."""
+    return graph.organization
+
+
+@pytest.fixture(scope="module")
+def org_admin_membership(graph):
+    """Make org_admin an admin of the organization."""
+    return graph.org_admin_membership
+
+
+@pytest.fixture(scope="module")
+def standalone_team(graph):
+    """A standalone team (no organization)."""
+    return graph.standalone_team
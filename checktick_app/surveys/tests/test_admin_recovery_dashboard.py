@@ -11,110 +11,113 @@ These tests verify:
 
 import uuid
 
-from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client, RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
+from django_ratelimit.core import get_usage
 import pytest
 
-from checktick_app.surveys.models import (
-    Organization,
-    OrganizationMembership,
-    RecoveryRequest,
-    Survey,
-    Team,
-)
+from checktick_app.surveys import views
+from checktick_app.surveys.models import RecoveryRequest, Survey
 
-User = get_user_model()
-TEST_PASSWORD = "x"
 
-
-@pytest.fixture
-def regular_user(db):
-    """A regular authenticated user."""
-    return User.objects.create_user(
-        username="regularuser",
-        email="regular@example.com",
-        password=TEST_PASSWORD,
+def _url_template(name):
+    """Reverse a per-request URL once, leaving {request_id} to be filled in."""
+    placeholder = str(uuid.UUID(int=0))
+    return reverse(name, kwargs={"request_id": placeholder}).replace(
+        placeholder, "{request_id}"
     )
 
 
-@pytest.fixture
-def org_owner(db):
-    """An organization owner."""
-    return User.objects.create_user(
-        username="orgowner",
-        email="orgowner@example.com",
-        password=TEST_PASSWORD,
-    )
+DASHBOARD_URL = reverse("surveys:admin_recovery_dashboard")
+DETAIL_URL = _url_template("surveys:admin_recovery_detail")
+APPROVE_PRIMARY_URL = _url_template("surveys:admin_recovery_approve_primary")
+APPROVE_SECONDARY_URL = _url_template("surveys:admin_recovery_approve_secondary")
+REJECT_URL = _url_template("surveys:admin_recovery_reject")
 
+# Ceiling on the fixed cost of rendering the dashboard (session, user, access
+# checks, stats, the joined request list and the base template's own lookups).
+# Per-row lookups are covered by the query-count growth test.
+DASHBOARD_MAX_QUERIES = 20
 
-@pytest.fixture
-def org_admin(db):
-    """An organization admin (not owner)."""
-    return User.objects.create_user(
-        username="orgadmin",
-        email="orgadmin@example.com",
-        password=TEST_PASSWORD,
-    )
 
+pytestmark = pytest.mark.django_db
 
-@pytest.fixture
-def team_owner(db):
-    """A team owner."""
-    return User.objects.create_user(
-        username="teamowner",
-        email="teamowner@example.com",
-        password=TEST_PASSWORD,
-    )
 
+@pytest.fixture(scope="module")
+def signed_cookie_sessions():
+    """
+    Keep sessions in signed cookies rather than the database.
 
-@pytest.fixture
-def organization(db, org_owner):
-    """An organization for testing."""
-    return Organization.objects.create(
-        name="Test Organization",
-        owner=org_owner,
-    )
-
-
-@pytest.fixture
-def org_admin_membership(db, organization, org_admin):
-    """Make org_admin an admin of the organization."""
-    return OrganizationMembership.objects.create(
-        organization=organization,
-        user=org_admin,
-        role=OrganizationMembership.Role.ADMIN,
-    )
-
-
-@pytest.fixture
-def standalone_team(db, team_owner):
-    """A standalone team (no organization)."""
-    return Team.objects.create(
-        name="Standalone Team",
-        owner=team_owner,
-    )
-
-
-@pytest.fixture
-def org_survey(db, regular_user, organization):
+    SESSION_SAVE_EVERY_REQUEST is on, so database sessions cost a read and a
+    write on every request; nothing here depends on sessions being stored.
+    """
+    with override_settings(
+        SESSION_ENGINE="django.contrib.sessions.backends.signed_cookies"
+    ):
+        yield
+
+
+@pytest.fixture(scope="module")
+def authed_clients(graph, signed_cookie_sessions, django_db_blocker):
+    """
+    A logged-in test client per user, keyed by username.
+
+    Logging in happens once for the module rather than once per test.
+    """
+    clients = {}
+    with django_db_blocker.unblock():
+        for user in (
+            graph.regular_user,
+            graph.org_owner,
+            graph.org_admin,
+            graph.team_owner,
+        ):
+            client = Client()
+            client.force_login(user)
+            clients[user.username] = client
+    return clients
+
+
+@pytest.fixture(autouse=True)
+def _reset_client_cookies(authed_clients, settings):
+    """
+    Drop cookies a test left on the shared clients (e.g. flash messages).
+
+    Unlike logout(), this keeps the session cookie, so the login is reused.
+    """
+    yield
+    for client in authed_clients.values():
+        for name in list(client.cookies):
+            if name != settings.SESSION_COOKIE_NAME:
+                del client.cookies[name]
+
+
+@pytest.fixture(scope="module")
+def org_survey(regular_user, organization, django_db_blocker):
     """A survey belonging to an organization."""
-    return Survey.objects.create(
-        name="Org Survey",
-        slug=f"org-survey-{uuid.uuid4().hex[:8]}",
-        owner=regular_user,
-        organization=organization,
-    )
+    with django_db_blocker.unblock():
+        return Survey.objects.create(
+            name="Org Survey",
+            slug="org-survey-test",
+            owner=regular_user,
+            organization=organization,
+        )
 
 
-@pytest.fixture
-def team_survey(db, regular_user, standalone_team):
+@pytest.fixture(scope="module")
+def team_survey(regular_user, standalone_team, django_db_blocker):
     """A survey belonging to a standalone team."""
-    return Survey.objects.create(
-        name="Team Survey",
-        slug=f"team-survey-{uuid.uuid4().hex[:8]}",
-        owner=regular_user,
-        team=standalone_team,
-    )
+    with django_db_blocker.unblock():
+        return Survey.objects.create(
+            name="Team Survey",
+            slug="team-survey-test",
+            owner=regular_user,
+            team=standalone_team,
+        )
 
 
 @pytest.fixture
@@ -141,59 +144,71 @@ def team_recovery_request(db, regular_user, team_survey):
 
 @pytest.fixture
 def disable_rate_limiting(settings):
-    """Disable rate limiting for tests."""
+    """Disable rate limiting, and caching with it, for tests."""
     settings.RATELIMIT_ENABLE = False
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}
+    }
+
+
+def _state(recovery_request):
+    """Fetch just the approval fields of a recovery request."""
+    return (
+        RecoveryRequest.objects.filter(pk=recovery_request.pk)
+        .values(
+            "status", "primary_approver_id", "secondary_approver_id", "rejected_by_id"
+        )
+        .get()
+    )
 
 
 class TestOrgAdminDashboardAccess:
     """Test that org admins can access their scoped dashboard."""
 
     def test_regular_user_without_context_redirected(
-        self, client, regular_user, disable_rate_limiting
+        self, authed_clients, disable_rate_limiting
     ):
         """Regular users without org/team context are redirected."""
-        client.force_login(regular_user)
-        url = reverse("surveys:admin_recovery_dashboard")
-        response = client.get(url)
+        client = authed_clients["regularuser"]
+        response = client.get(DASHBOARD_URL)
         assert response.status_code == 302  # Redirected to surveys
 
     def test_org_owner_can_access_dashboard(
-        self,
-        client,
-        org_owner,
-        organization,
-        org_recovery_request,
-        disable_rate_limiting,
+        self, authed_clients, organization, org_recovery_request, disable_rate_limiting
     ):
         """Org owner can access their org's recovery dashboard."""
-        client.force_login(org_owner)
-        url = reverse("surveys:admin_recovery_dashboard") + f"?org={organization.id}"
+        client = authed_clients["orgowner"]
+        url = DASHBOARD_URL + f"?org={organization.id}"
         response = client.get(url)
         assert response.status_code == 200
-        assert b"Test Organization Recovery Dashboard" in response.content
+        assert (
+            response.context["dashboard_title"]
+            == "Test Organization Recovery Dashboard"
+        )
 
     def test_org_admin_can_access_dashboard(
         self,
-        client,
-        org_admin,
+        authed_clients,
         organization,
         org_admin_membership,
         org_recovery_request,
         disable_rate_limiting,
     ):
         """Org admin can access their org's recovery dashboard."""
-        client.force_login(org_admin)
-        url = reverse("surveys:admin_recovery_dashboard") + f"?org={organization.id}"
-        response = client.get(url)
+        client = authed_clients["orgadmin"]
+        url = DASHBOARD_URL + f"?org={organization.id}"
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(url)
         assert response.status_code == 200
-        assert b"Organisation Admin" in response.content
+        assert len(queries) <= DASHBOARD_MAX_QUERIES
+        assert response.context["tier_display"] == "Organisation Admin"
 
     def test_non_member_cannot_access_org_dashboard(
-        self, client, regular_user, organization, disable_rate_limiting
+        self, authed_clients, organization, disable_rate_limiting
     ):
         """Non-members cannot access an org's recovery dashboard."""
-        client.force_login(regular_user)
-        url = reverse("surveys:admin_recovery_dashboard") + f"?org={organization.id}"
+        client = authed_clients["regularuser"]
+        url = DASHBOARD_URL + f"?org={organization.id}"
         response = client.get(url)
         assert response.status_code == 302  # Redirected
 
@@ -203,30 +218,27 @@ class TestTeamOwnerDashboardAccess:
 
     def test_team_owner_can_access_dashboard(
         self,
-        client,
-        team_owner,
+        authed_clients,
         standalone_team,
         team_recovery_request,
         disable_rate_limiting,
     ):
         """Team owner can access their team's recovery dashboard."""
-        client.force_login(team_owner)
-        url = (
-            reverse("surveys:admin_recovery_dashboard") + f"?team={standalone_team.id}"
-        )
+        client = authed_clients["teamowner"]
+        url = DASHBOARD_URL + f"?team={standalone_team.id}"
         response = client.get(url)
         assert response.status_code == 200
-        assert b"Standalone Team Recovery Dashboard" in response.content
-        assert b"Team Owner" in response.content
+        assert (
+            response.context["dashboard_title"] == "Standalone Team Recovery Dashboard"
+        )
+        assert response.context["tier_display"] == "Team Owner"
 
     def test_non_member_cannot_access_team_dashboard(
-        self, client, regular_user, standalone_team, disable_rate_limiting
+        self, authed_clients, standalone_team, disable_rate_limiting
     ):
         """Non-members cannot access a team's recovery dashboard."""
-        client.force_login(regular_user)
-        url = (
-            reverse("surveys:admin_recovery_dashboard") + f"?team={standalone_team.id}"
-        )
+        client = authed_clients["regularuser"]
+        url = DASHBOARD_URL + f"?team={standalone_team.id}"
         response = client.get(url)
         assert response.status_code == 302  # Redirected
 
@@ -236,43 +248,77 @@ class TestScopedRequests:
 
     def test_org_dashboard_only_shows_org_requests(
         self,
-        client,
-        org_owner,
+        authed_clients,
         organization,
         org_recovery_request,
         team_recovery_request,
         disable_rate_limiting,
     ):
         """Org dashboard only shows requests for org surveys."""
-        client.force_login(org_owner)
-        url = reverse("surveys:admin_recovery_dashboard") + f"?org={organization.id}"
-        response = client.get(url)
+        org_code = org_recovery_request.request_code.encode()
+        team_code = team_recovery_request.request_code.encode()
+        client = authed_clients["orgowner"]
+        url = DASHBOARD_URL + f"?org={organization.id}"
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(url)
         assert response.status_code == 200
+        assert len(queries) <= DASHBOARD_MAX_QUERIES
         # Should see org request
-        assert org_recovery_request.request_code.encode() in response.content
+        assert org_code in response.content
         # Should NOT see team request
-        assert team_recovery_request.request_code.encode() not in response.content
+        assert team_code not in response.content
 
     def test_team_dashboard_only_shows_team_requests(
         self,
-        client,
-        team_owner,
+        authed_clients,
         standalone_team,
         org_recovery_request,
         team_recovery_request,
         disable_rate_limiting,
     ):
         """Team dashboard only shows requests for team surveys."""
-        client.force_login(team_owner)
-        url = (
-            reverse("surveys:admin_recovery_dashboard") + f"?team={standalone_team.id}"
-        )
-        response = client.get(url)
+        org_code = org_recovery_request.request_code.encode()
+        team_code = team_recovery_request.request_code.encode()
+        client = authed_clients["teamowner"]
+        url = DASHBOARD_URL + f"?team={standalone_team.id}"
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(url)
         assert response.status_code == 200
+        assert len(queries) <= DASHBOARD_MAX_QUERIES
         # Should see team request
-        assert team_recovery_request.request_code.encode() in response.content
+        assert team_code in response.content
         # Should NOT see org request
-        assert org_recovery_request.request_code.encode() not in response.content
+        assert org_code not in response.content
+
+    def test_dashboard_query_count_does_not_grow_with_requests(
+        self,
+        authed_clients,
+        regular_user,
+        org_owner,
+        organization,
+        org_survey,
+        org_recovery_request,
+        disable_rate_limiting,
+    ):
+        """Users, surveys and approvers are joined, not fetched per row."""
+        client = authed_clients["orgowner"]
+        url = DASHBOARD_URL + f"?org={organization.id}"
+        with CaptureQueriesContext(connection) as one_request:
+            client.get(url)
+
+        for reason in ("Lost key again", "Lost key a third time"):
+            RecoveryRequest.objects.create(
+                user=regular_user,
+                survey=org_survey,
+                user_context={"reason": reason},
+                status=RecoveryRequest.Status.AWAITING_SECONDARY,
+                primary_approver=org_owner,
+            )
+        with CaptureQueriesContext(connection) as three_requests:
+            response = client.get(url)
+
+        assert response.status_code == 200
+        assert len(three_requests) == len(one_request)
 
 
 class TestOrgAdminApproval:
@@ -280,31 +326,28 @@ class TestOrgAdminApproval:
 
     def test_org_owner_can_approve_primary(
         self,
-        client,
+        authed_clients,
         org_owner,
         organization,
         org_recovery_request,
         disable_rate_limiting,
     ):
         """Org owner can approve as primary."""
-        client.force_login(org_owner)
+        client = authed_clients["orgowner"]
         url = (
-            reverse(
-                "surveys:admin_recovery_approve_primary",
-                kwargs={"request_id": org_recovery_request.id},
-            )
+            APPROVE_PRIMARY_URL.format(request_id=org_recovery_request.id)
             + f"?org={organization.id}"
         )
         response = client.post(url)
         assert response.status_code == 302
 
-        org_recovery_request.refresh_from_db()
-        assert org_recovery_request.status == RecoveryRequest.Status.AWAITING_SECONDARY
-        assert org_recovery_request.primary_approver == org_owner
+        state = _state(org_recovery_request)
+        assert state["status"] == RecoveryRequest.Status.AWAITING_SECONDARY
+        assert state["primary_approver_id"] == org_owner.id
 
     def test_dual_approval_requires_different_admins(
         self,
-        client,
+        authed_clients,
         org_owner,
         org_admin,
         organization,
@@ -313,39 +356,32 @@ class TestOrgAdminApproval:
         disable_rate_limiting,
     ):
         """Secondary approval must be from different admin."""
-        # First: org_owner approves as primary
-        client.force_login(org_owner)
-        url = (
-            reverse(
-                "surveys:admin_recovery_approve_primary",
-                kwargs={"request_id": org_recovery_request.id},
-            )
-            + f"?org={organization.id}"
+        # First: org_owner has approved as primary (the HTTP path for that is
+        # covered by test_org_owner_can_approve_primary)
+        org_recovery_request.status = RecoveryRequest.Status.AWAITING_SECONDARY
+        org_recovery_request.primary_approver = org_owner
+        org_recovery_request.primary_approved_at = timezone.now()
+        org_recovery_request.save(
+            update_fields=["status", "primary_approver", "primary_approved_at"]
         )
-        client.post(url)
-
-        org_recovery_request.refresh_from_db()
-        assert org_recovery_request.status == RecoveryRequest.Status.AWAITING_SECONDARY
 
         # Second: org_owner tries to approve secondary (should fail)
+        client = authed_clients["orgowner"]
         url = (
-            reverse(
-                "surveys:admin_recovery_approve_secondary",
-                kwargs={"request_id": org_recovery_request.id},
-            )
+            APPROVE_SECONDARY_URL.format(request_id=org_recovery_request.id)
             + f"?org={organization.id}"
         )
         client.post(url)
-        org_recovery_request.refresh_from_db()
+        state = _state(org_recovery_request)
         # Should still be awaiting secondary (same admin can't approve twice)
-        assert org_recovery_request.status == RecoveryRequest.Status.AWAITING_SECONDARY
+        assert state["status"] == RecoveryRequest.Status.AWAITING_SECONDARY
 
         # Third: org_admin approves as secondary (should succeed)
-        client.force_login(org_admin)
+        client = authed_clients["orgadmin"]
         client.post(url)
-        org_recovery_request.refresh_from_db()
-        assert org_recovery_request.status == RecoveryRequest.Status.IN_TIME_DELAY
-        assert org_recovery_request.secondary_approver == org_admin
+        state = _state(org_recovery_request)
+        assert state["status"] == RecoveryRequest.Status.IN_TIME_DELAY
+        assert state["secondary_approver_id"] == org_admin.id
 
 
 class TestTeamOwnerApproval:
@@ -353,27 +389,24 @@ class TestTeamOwnerApproval:
 
     def test_team_owner_can_approve_primary(
         self,
-        client,
+        authed_clients,
         team_owner,
         standalone_team,
         team_recovery_request,
         disable_rate_limiting,
     ):
         """Team owner can approve as primary."""
-        client.force_login(team_owner)
+        client = authed_clients["teamowner"]
         url = (
-            reverse(
-                "surveys:admin_recovery_approve_primary",
-                kwargs={"request_id": team_recovery_request.id},
-            )
+            APPROVE_PRIMARY_URL.format(request_id=team_recovery_request.id)
             + f"?team={standalone_team.id}"
         )
         response = client.post(url)
         assert response.status_code == 302
 
-        team_recovery_request.refresh_from_db()
-        assert team_recovery_request.status == RecoveryRequest.Status.AWAITING_SECONDARY
-        assert team_recovery_request.primary_approver == team_owner
+        state = _state(team_recovery_request)
+        assert state["status"] == RecoveryRequest.Status.AWAITING_SECONDARY
+        assert state["primary_approver_id"] == team_owner.id
 
 
 class TestRejectAction:
@@ -381,47 +414,36 @@ class TestRejectAction:
 
     def test_org_admin_can_reject(
         self,
-        client,
+        authed_clients,
         org_owner,
         organization,
         org_recovery_request,
         disable_rate_limiting,
     ):
         """Org admin can reject requests."""
-        client.force_login(org_owner)
+        client = authed_clients["orgowner"]
         url = (
-            reverse(
-                "surveys:admin_recovery_reject",
-                kwargs={"request_id": org_recovery_request.id},
-            )
+            REJECT_URL.format(request_id=org_recovery_request.id)
             + f"?org={organization.id}"
         )
         response = client.post(url, {"reason": "Suspicious request"})
         assert response.status_code == 302
 
-        org_recovery_request.refresh_from_db()
-        assert org_recovery_request.status == RecoveryRequest.Status.REJECTED
-        assert org_recovery_request.rejected_by == org_owner
+        state = _state(org_recovery_request)
+        assert state["status"] == RecoveryRequest.Status.REJECTED
+        assert state["rejected_by_id"] == org_owner.id
 
 
 class TestCrossOrgAccess:
     """Test that admins cannot access requests outside their scope."""
 
     def test_org_admin_cannot_approve_team_request(
-        self,
-        client,
-        org_owner,
-        organization,
-        team_recovery_request,
-        disable_rate_limiting,
+        self, authed_clients, organization, team_recovery_request, disable_rate_limiting
     ):
         """Org admin cannot approve a team's recovery request."""
-        client.force_login(org_owner)
+        client = authed_clients["orgowner"]
         url = (
-            reverse(
-                "surveys:admin_recovery_approve_primary",
-                kwargs={"request_id": team_recovery_request.id},
-            )
+            APPROVE_PRIMARY_URL.format(request_id=team_recovery_request.id)
             + f"?org={organization.id}"
         )
         response = client.post(url)
@@ -429,19 +451,15 @@ class TestCrossOrgAccess:
 
     def test_team_owner_cannot_approve_org_request(
         self,
-        client,
-        team_owner,
+        authed_clients,
         standalone_team,
         org_recovery_request,
         disable_rate_limiting,
     ):
         """Team owner cannot approve an org's recovery request."""
-        client.force_login(team_owner)
+        client = authed_clients["teamowner"]
         url = (
-            reverse(
-                "surveys:admin_recovery_approve_primary",
-                kwargs={"request_id": org_recovery_request.id},
-            )
+            APPROVE_PRIMARY_URL.format(request_id=org_recovery_request.id)
             + f"?team={standalone_team.id}"
         )
         response = client.post(url)
@@ -452,20 +470,12 @@ class TestDetailView:
     """Test detail view access."""
 
     def test_org_admin_can_view_org_request_detail(
-        self,
-        client,
-        org_owner,
-        organization,
-        org_recovery_request,
-        disable_rate_limiting,
+        self, authed_clients, organization, org_recovery_request, disable_rate_limiting
     ):
         """Org admin can view detail of org request."""
-        client.force_login(org_owner)
+        client = authed_clients["orgowner"]
         url = (
-            reverse(
-                "surveys:admin_recovery_detail",
-                kwargs={"request_id": org_recovery_request.id},
-            )
+            DETAIL_URL.format(request_id=org_recovery_request.id)
             + f"?org={organization.id}"
         )
         response = client.get(url)
@@ -473,97 +483,85 @@ class TestDetailView:
         assert org_recovery_request.request_code.encode() in response.content
 
     def test_org_admin_cannot_view_team_request_detail(
-        self,
-        client,
-        org_owner,
-        organization,
-        team_recovery_request,
-        disable_rate_limiting,
+        self, authed_clients, organization, team_recovery_request, disable_rate_limiting
     ):
         """Org admin cannot view detail of team request."""
-        client.force_login(org_owner)
+        client = authed_clients["orgowner"]
         url = (
-            reverse(
-                "surveys:admin_recovery_detail",
-                kwargs={"request_id": team_recovery_request.id},
-            )
+            DETAIL_URL.format(request_id=team_recovery_request.id)
             + f"?org={organization.id}"
         )
         response = client.get(url)
         assert response.status_code == 302  # Redirected with error
 
 
-@pytest.mark.django_db
+@pytest.mark.slow
 class TestRateLimiting:
     """Test rate limiting on admin recovery dashboard endpoints."""
 
-    def test_dashboard_rate_limited(self, client, org_owner, organization, settings):
-        """Dashboard endpoint is rate limited to 20/hour."""
-        settings.RATELIMIT_ENABLE = True
-        client.force_login(org_owner)
-        url = reverse("surveys:admin_recovery_dashboard") + f"?org={organization.id}"
-
-        # Make 21 requests - the 21st should be blocked
-        for i in range(21):
-            response = client.get(url)
-            if i < 20:
-                assert response.status_code in [
-                    200,
-                    302,
-                ], f"Request {i+1} should succeed"
-            else:
-                assert response.status_code == 403, "Request 21 should be rate limited"
-
-    def test_approval_action_rate_limited(
-        self, client, org_owner, organization, org_recovery_request, settings
-    ):
-        """Approval endpoints are rate limited to 5/hour."""
-        settings.RATELIMIT_ENABLE = True
-        client.force_login(org_owner)
-        url = (
-            reverse(
-                "surveys:admin_recovery_approve_primary",
-                kwargs={"request_id": org_recovery_request.id},
-            )
-            + f"?org={organization.id}"
-        )
-
-        # Make 6 requests - the 6th should be blocked
-        for i in range(6):
-            response = client.post(url)
-            if i < 5:
-                # First 5 may succeed or redirect (depending on request state)
-                assert response.status_code in [
-                    200,
-                    302,
-                    403,
-                ], f"Request {i+1} unexpected status"
-            else:
-                assert response.status_code == 403, "Request 6 should be rate limited"
-
-    def test_reject_action_rate_limited(
-        self, client, org_owner, organization, org_recovery_request, settings
+    @pytest.fixture(autouse=True)
+    def _ratelimit_cache(self, settings):
+        """Rate-limit counters live in a fresh in-process cache."""
+        settings.CACHES = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "recovery-ratelimit-tests",
+            }
+        }
+        cache.clear()
+
+    @staticmethod
+    def _use_up(view, user, rate, count):
+        """Record `count` hits against `view` for `user`, as if already made."""
+        request = RequestFactory().get("/")
+        request.user = user
+        for _ in range(count):
+            get_usage(request, fn=view, key="user", rate=rate, increment=True)
+
+    @pytest.mark.parametrize(
+        "view,url,method,rate,data",
+        [
+            (views.admin_recovery_dashboard, DASHBOARD_URL, "get", "20/h", {}),
+            (
+                views.admin_recovery_approve_primary,
+                APPROVE_PRIMARY_URL,
+                "post",
+                "5/h",
+                {},
+            ),
+            (
+                views.admin_recovery_reject,
+                REJECT_URL,
+                "post",
+                "5/h",
+                {"reason": "Test rejection"},
+            ),
+        ],
+        ids=["dashboard", "approve_primary", "reject"],
+    )
+    def test_endpoint_rate_limited(
+        self,
+        view,
+        url,
+        method,
+        rate,
+        data,
+        authed_clients,
+        org_owner,
+        organization,
+        org_recovery_request,
+        settings,
     ):
-        """Reject endpoint is rate limited to 5/hour."""
+        """Dashboard is limited to 20/hour; approval and reject to 5/hour."""
         settings.RATELIMIT_ENABLE = True
-        client.force_login(org_owner)
-        url = (
-            reverse(
-                "surveys:admin_recovery_reject",
-                kwargs={"request_id": org_recovery_request.id},
-            )
-            + f"?org={organization.id}"
-        )
-
-        # Make 6 requests - the 6th should be blocked
-        for i in range(6):
-            response = client.post(url, {"reason": "Test rejection"})
-            if i < 5:
-                # First 5 may succeed or redirect (depending on request state)
-                assert response.status_code in [
-                    200,
-                    302,
-                    403,
-                ], f"Request {i+1} unexpected status"
-            else:
-                assert response.status_code == 403, "Request 6 should be rate limited"
+        client = authed_clients["orgowner"]
+        url = url.format(request_id=org_recovery_request.id)
+        url += f"?org={organization.id}"
+        limit = int(rate.split("/")[0])
+        self._use_up(view, org_owner, rate, limit - 1)
+        send = getattr(client, method)
+
+        response = send(url, data)
+        assert response.status_code in [200, 302], f"Request {limit} should succeed"
+        response = send(url, data)
+        assert response.status_code == 403, f"Request {limit + 1} should be limited"
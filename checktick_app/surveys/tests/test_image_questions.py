@@ -6,11 +6,15 @@ non-medical, non-patient-identifying content.
 """
 
 import io
+import struct
 
-from django.core.files.uploadedfile import SimpleUploadedFile
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import InMemoryUploadedFile, SimpleUploadedFile
+from django.test import Client, override_settings
 from django.urls import reverse
 import pytest
 
+from checktick_app.surveys import views
 from checktick_app.surveys.models import (
     QuestionImage,
     Survey,
@@ -22,51 +26,117 @@ from checktick_app.surveys.models import (
 TEST_PASSWORD = "x"
 
 
-@pytest.fixture
-def survey(db, django_user_model):
-    """Create a basic survey with an owner."""
-    user = django_user_model.objects.create_user(
-        username="testuser", password=TEST_PASSWORD, email="test@example.com"
-    )
-    survey = Survey.objects.create(
-        name="Test Survey",
-        slug="test-survey",
-        owner=user,
-    )
-    return survey
+# A valid 1x1 red PNG (signature, IHDR, IDAT, IEND), so the common fixtures
+# need no Pillow work; each test wraps the bytes in a fresh upload
+_MINIMAL_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010802000000907753de"
+    "0000000c4944415478da63f8cfc0000003010100f70341430000000049454e44ae426082"
+)
 
+# A stored file name with nothing behind it, for tests where only the row
+# matters; deleting a missing file from FileSystemStorage is a no-op
+_UNSTORED_IMAGE = "question_images/unstored.png"
 
-@pytest.fixture
-def image_question(survey):
-    """Create an image choice question."""
-    return SurveyQuestion.objects.create(
-        survey=survey,
-        text="Select an image",
-        type=SurveyQuestion.Types.IMAGE_CHOICE,
-        order=0,
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.usefixtures("fast_password_hasher"),
+]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def media_root(tmp_path_factory):
+    """Write uploaded images to a temporary directory, not the project's media."""
+    with override_settings(MEDIA_ROOT=tmp_path_factory.mktemp("media")):
+        yield
+
+
+@pytest.fixture(scope="module")
+def client():
+    """
+    One test client for the whole module.
+
+    The client builds its middleware chain on the first request; sharing it
+    means that happens once rather than in every test.
+    """
+    return Client()
+
+
+@pytest.fixture(autouse=True)
+def _reset_client(client):
+    """Log the shared client out after each test by dropping its cookies."""
+    yield
+    client.cookies.clear()
+
+
+@pytest.fixture(scope="module")
+def survey_owner(module_db, fast_password_hasher, django_db_blocker):
+    """The user who owns the test survey, created once for the module."""
+    with django_db_blocker.unblock():
+        return get_user_model().objects.create_user(
+            username="testuser", password=TEST_PASSWORD, email="test@example.com"
+        )
+
+
+@pytest.fixture(scope="module")
+def survey(survey_owner, django_db_blocker):
+    """
+    Create a basic survey with an owner, once for the module.
+
+    Each test runs in a savepoint inside the module transaction, so whatever
+    a test changes is rolled back before the next one.
+    """
+    with django_db_blocker.unblock():
+        return Survey.objects.create(
+            name="Test Survey",
+            slug="test-survey",
+            owner=survey_owner,
+        )
+
+
+@pytest.fixture(scope="module")
+def image_question(survey, django_db_blocker):
+    """Create an image choice question, once for the module."""
+    with django_db_blocker.unblock():
+        return SurveyQuestion.objects.create(
+            survey=survey,
+            text="Select an image",
+            type=SurveyQuestion.Types.IMAGE_CHOICE,
+            order=0,
+        )
+
+
+@pytest.fixture(scope="module")
+def upload_url(image_question):
+    """The image question's upload URL, reversed once for the module."""
+    return reverse(
+        "surveys:builder_question_image_upload",
+        kwargs={"slug": image_question.survey.slug, "qid": image_question.id},
     )
 
 
-@pytest.fixture
-def sample_image():
-    """Create a simple valid image file."""
-    # Create a simple 1x1 pixel PNG
-    from PIL import Image
+@pytest.fixture(scope="module")
+def delete_url(image_question):
+    """Build an image's delete URL from a template reversed once for the module."""
+    template = reverse(
+        "surveys:builder_question_image_delete",
+        kwargs={
+            "slug": image_question.survey.slug,
+            "qid": image_question.id,
+            "img_id": 0,
+        },
+    ).replace("/images/0/", "/images/{img_id}/")
+
+    def build(img_id):
+        return template.format(img_id=img_id)
 
-    img = Image.new("RGB", (100, 100), color="red")
-    buffer = io.BytesIO()
-    img.save(buffer, format="PNG")
-    buffer.seek(0)
-    return SimpleUploadedFile("test.png", buffer.read(), content_type="image/png")
+    return build
 
 
 @pytest.fixture
-def large_image():
-    """Create an image that exceeds the size limit (>1MB)."""
-    # Create a file with more than 1MB of data
-    # A simple approach: repeat image data until it's over 1MB
-    data = b"x" * (1024 * 1024 + 1)  # 1MB + 1 byte
-    return SimpleUploadedFile("large.png", data, content_type="image/png")
+def sample_image():
+    """Create a simple valid image file."""
+    return SimpleUploadedFile("test.png", _MINIMAL_PNG, content_type="image/png")
 
 
 class TestQuestionImageModel:
@@ -88,28 +158,25 @@ class TestQuestionImageModel:
 
     def test_question_image_ordering(self, image_question, sample_image):
         """Test that images are ordered by order field then id."""
-        img2 = QuestionImage.objects.create(
-            question=image_question,
-            image=sample_image,
-            label="Second",
-            order=1,
-        )
-        # Create another sample image for first
-        from PIL import Image
-
-        img_file = Image.new("RGB", (100, 100), color="green")
-        buffer = io.BytesIO()
-        img_file.save(buffer, format="PNG")
-        buffer.seek(0)
+        # "Second" is inserted first, so it gets the lower id
         first_image = SimpleUploadedFile(
-            "test2.png", buffer.read(), content_type="image/png"
+            "test2.png", _MINIMAL_PNG, content_type="image/png"
         )
-
-        img1 = QuestionImage.objects.create(
-            question=image_question,
-            image=first_image,
-            label="First",
-            order=0,
+        img2, img1 = QuestionImage.objects.bulk_create(
+            [
+                QuestionImage(
+                    question=image_question,
+                    image=sample_image,
+                    label="Second",
+                    order=1,
+                ),
+                QuestionImage(
+                    question=image_question,
+                    image=first_image,
+                    label="First",
+                    order=0,
+                ),
+            ]
         )
 
         images = list(image_question.images.all())
@@ -125,45 +192,36 @@ class TestQuestionImageModel:
             order=0,
         )
         question_id = image_question.id
-        image_question.delete()
+        # Delete through a queryset so the shared fixture instance keeps its pk
+        SurveyQuestion.objects.filter(id=question_id).delete()
         assert QuestionImage.objects.filter(question_id=question_id).count() == 0
 
 
 class TestImageUploadView:
     """Tests for the image upload endpoint."""
 
-    def test_upload_requires_authentication(self, client, image_question):
+    def test_upload_requires_authentication(self, client, upload_url):
         """Test that unauthenticated users cannot upload images."""
-        url = reverse(
-            "surveys:builder_question_image_upload",
-            kwargs={"slug": image_question.survey.slug, "qid": image_question.id},
-        )
-        response = client.post(url)
+        response = client.post(upload_url)
         assert response.status_code == 302  # Redirect to login
 
     def test_upload_requires_edit_permission(
-        self, client, image_question, django_user_model
+        self, client, upload_url, django_user_model
     ):
         """Test that users without edit permission cannot upload."""
-        django_user_model.objects.create_user(
+        other = django_user_model.objects.create_user(
             username="other", password=TEST_PASSWORD, email="other@example.com"
         )
-        client.login(username="other", password=TEST_PASSWORD)
-        url = reverse(
-            "surveys:builder_question_image_upload",
-            kwargs={"slug": image_question.survey.slug, "qid": image_question.id},
-        )
-        response = client.post(url)
+        client.force_login(other)
+        response = client.post(upload_url)
         assert response.status_code == 403
 
-    def test_upload_success(self, client, image_question, sample_image):
+    def test_upload_success(
+        self, client, image_question, upload_url, survey_owner, sample_image
+    ):
         """Test successful image upload."""
-        client.login(username="testuser", password=TEST_PASSWORD)
-        url = reverse(
-            "surveys:builder_question_image_upload",
-            kwargs={"slug": image_question.survey.slug, "qid": image_question.id},
-        )
-        response = client.post(url, {"image": sample_image, "label": "My Image"})
+        client.force_login(survey_owner)
+        response = client.post(upload_url, {"image": sample_image, "label": "My Image"})
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
@@ -175,54 +233,55 @@ class TestImageUploadView:
         img = image_question.images.first()
         assert img.label == "My Image"
 
-    def test_upload_no_image(self, client, image_question):
+    def test_upload_no_image(self, client, upload_url, survey_owner):
         """Test upload fails without an image file."""
-        client.login(username="testuser", password=TEST_PASSWORD)
-        url = reverse(
-            "surveys:builder_question_image_upload",
-            kwargs={"slug": image_question.survey.slug, "qid": image_question.id},
-        )
-        response = client.post(url, {"label": "No Image"})
+        client.force_login(survey_owner)
+        response = client.post(upload_url, {"label": "No Image"})
         assert response.status_code == 400
         data = response.json()
         assert data["success"] is False
         assert "No image file" in data["error"]
 
-    def test_upload_rejects_large_file(self, client, image_question, large_image):
-        """Test that files larger than 1MB are rejected."""
-        client.login(username="testuser", password=TEST_PASSWORD)
-        url = reverse(
-            "surveys:builder_question_image_upload",
-            kwargs={"slug": image_question.survey.slug, "qid": image_question.id},
-        )
-        response = client.post(url, {"image": large_image, "label": "Large"})
+    def test_upload_rejects_large_file(
+        self, client, upload_url, survey_owner, sample_image, monkeypatch
+    ):
+        """Test that files over the size limit are rejected."""
+        # Shrink the limit rather than posting a 1MB body through the client
+        monkeypatch.setattr(views, "MAX_IMAGE_SIZE", len(_MINIMAL_PNG) - 1)
+        client.force_login(survey_owner)
+        response = client.post(upload_url, {"image": sample_image, "label": "Large"})
         assert response.status_code == 400
         data = response.json()
         assert data["success"] is False
         assert "1MB" in data["error"]
 
-    def test_upload_rejects_non_image(self, client, image_question):
-        """Test that non-image files are rejected."""
-        client.login(username="testuser", password=TEST_PASSWORD)
-        url = reverse(
-            "surveys:builder_question_image_upload",
-            kwargs={"slug": image_question.survey.slug, "qid": image_question.id},
+    def test_size_limit_checked_before_reading(self):
+        """Files over 1MB are rejected on their reported size, unread."""
+        stream = io.BytesIO()
+        oversized = InMemoryUploadedFile(
+            stream, "image", "large.png", "image/png", 1024 * 1024 + 1, None
         )
+        success, error = views._validate_and_process_image(oversized)
+        assert success is False
+        assert "1MB" in error
+        assert stream.tell() == 0
+
+    def test_upload_rejects_non_image(self, client, upload_url, survey_owner):
+        """Test that non-image files are rejected."""
+        client.force_login(survey_owner)
         fake_file = SimpleUploadedFile(
             "test.txt", b"not an image", content_type="text/plain"
         )
-        response = client.post(url, {"image": fake_file, "label": "Not Image"})
+        response = client.post(upload_url, {"image": fake_file, "label": "Not Image"})
         assert response.status_code == 400
         data = response.json()
         assert data["success"] is False
 
-    def test_upload_rejects_svg_with_script(self, client, image_question):
+    def test_upload_rejects_svg_with_script(
+        self, client, image_question, upload_url, survey_owner
+    ):
         """SVG documents must not be stored where scripts can execute same-origin."""
-        client.login(username="testuser", password=TEST_PASSWORD)
-        url = reverse(
-            "surveys:builder_question_image_upload",
-            kwargs={"slug": image_question.survey.slug, "qid": image_question.id},
-        )
+        client.force_login(survey_owner)
         malicious_svg = SimpleUploadedFile(
             "stored-xss.svg",
             b'<svg xmlns="http://www.w3.org/2000/svg" onload="fetch(\'/api/\')"/>',
@@ -230,14 +289,16 @@ class TestImageUploadView:
         )
 
         response = client.post(
-            url, {"image": malicious_svg, "label": "Stored XSS payload"}
+            upload_url, {"image": malicious_svg, "label": "Stored XSS payload"}
         )
 
         assert response.status_code == 400
         assert response.json()["success"] is False
         assert image_question.images.count() == 0
 
-    def test_upload_rejects_animated_image(self, client, image_question):
+    def test_upload_rejects_animated_image(
+        self, client, image_question, upload_url, survey_owner
+    ):
         """Animated variants of allowed raster formats must be rejected."""
         from PIL import Image
 
@@ -257,13 +318,11 @@ class TestImageUploadView:
         animated_image = SimpleUploadedFile(
             "animated.png", buffer.getvalue(), content_type="image/png"
         )
-        client.login(username="testuser", password=TEST_PASSWORD)
-        url = reverse(
-            "surveys:builder_question_image_upload",
-            kwargs={"slug": image_question.survey.slug, "qid": image_question.id},
-        )
+        client.force_login(survey_owner)
 
-        response = client.post(url, {"image": animated_image, "label": "Animated"})
+        response = client.post(
+            upload_url, {"image": animated_image, "label": "Animated"}
+        )
 
         assert response.status_code == 400
         assert response.json()["success"] is False
@@ -274,59 +333,38 @@ class TestImageUploadView:
 class TestImageDeleteView:
     """Tests for the image delete endpoint."""
 
-    def test_delete_requires_authentication(self, client, image_question, sample_image):
+    def test_delete_requires_authentication(self, client, image_question, delete_url):
         """Test that unauthenticated users cannot delete images."""
         img = QuestionImage.objects.create(
             question=image_question,
-            image=sample_image,
+            image=_UNSTORED_IMAGE,
             label="Test",
             order=0,
         )
-        url = reverse(
-            "surveys:builder_question_image_delete",
-            kwargs={
-                "slug": image_question.survey.slug,
-                "qid": image_question.id,
-                "img_id": img.id,
-            },
-        )
+        url = delete_url(img.id)
         response = client.post(url)
         assert response.status_code == 302
 
-    def test_delete_success(self, client, image_question, sample_image):
+    def test_delete_success(self, client, image_question, delete_url, survey_owner):
         """Test successful image deletion."""
         img = QuestionImage.objects.create(
             question=image_question,
-            image=sample_image,
+            image=_UNSTORED_IMAGE,
             label="Test",
             order=0,
         )
-        client.login(username="testuser", password=TEST_PASSWORD)
-        url = reverse(
-            "surveys:builder_question_image_delete",
-            kwargs={
-                "slug": image_question.survey.slug,
-                "qid": image_question.id,
-                "img_id": img.id,
-            },
-        )
+        client.force_login(survey_owner)
+        url = delete_url(img.id)
         response = client.post(url)
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
         assert not QuestionImage.objects.filter(id=img.id).exists()
 
-    def test_delete_nonexistent_image(self, client, image_question):
+    def test_delete_nonexistent_image(self, client, delete_url, survey_owner):
         """Test deleting a non-existent image returns 404."""
-        client.login(username="testuser", password=TEST_PASSWORD)
-        url = reverse(
-            "surveys:builder_question_image_delete",
-            kwargs={
-                "slug": image_question.survey.slug,
-                "qid": image_question.id,
-                "img_id": 99999,
-            },
-        )
+        client.force_login(survey_owner)
+        url = delete_url(99999)
         response = client.post(url)
         assert response.status_code == 404
 
@@ -334,7 +372,9 @@ class TestImageDeleteView:
 class TestImageQuestionInSurvey:
     """Tests for image questions in the survey flow."""
 
-    def test_image_question_preview(self, client, image_question, sample_image):
+    def test_image_question_preview(
+        self, client, image_question, survey_owner, sample_image
+    ):
         """Test that image questions render in preview."""
         QuestionImage.objects.create(
             question=image_question,
@@ -342,7 +382,7 @@ class TestImageQuestionInSurvey:
             label="Option 1",
             order=0,
         )
-        client.login(username="testuser", password=TEST_PASSWORD)
+        client.force_login(survey_owner)
         url = reverse("surveys:preview", kwargs={"slug": image_question.survey.slug})
         response = client.get(url)
         assert response.status_code == 200
@@ -358,12 +398,9 @@ class TestImageQuestionInSurvey:
         )
 
         # Add membership so user can submit (use SurveyMembership, not Collaborator)
-        from django.contrib.auth import get_user_model
-
         from checktick_app.surveys.models import SurveyMembership
 
-        User = get_user_model()
-        respondent = User.objects.create_user(
+        respondent = get_user_model().objects.create_user(
             username="respondent", password=TEST_PASSWORD, email="resp@example.com"
         )
         SurveyMembership.objects.create(
@@ -372,7 +409,7 @@ class TestImageQuestionInSurvey:
             role=SurveyMembership.Role.VIEWER,
         )
 
-        client.login(username="respondent", password=TEST_PASSWORD)
+        client.force_login(respondent)
         url = reverse("surveys:detail", kwargs={"slug": image_question.survey.slug})
         response = client.post(url, {f"q_{image_question.id}": str(img.id)})
         # Should redirect after successful submission
@@ -390,31 +427,32 @@ class TestImageQuestionInSurvey:
 class TestImageResizing:
     """Tests for image resizing functionality."""
 
-    def test_large_dimensions_resized(self, client, image_question):
+    def test_large_dimensions_resized(
+        self, client, image_question, upload_url, survey_owner
+    ):
         """Test that images larger than 800x800 are resized."""
         from PIL import Image
 
-        # Create a large image (1000x1000)
-        img = Image.new("RGB", (1000, 1000), color="green")
+        # A large image (1000x1000)
         buffer = io.BytesIO()
-        img.save(buffer, format="PNG")
-        buffer.seek(0)
+        Image.new("RGB", (1000, 1000), color="green").save(buffer, format="PNG")
         large_dim_image = SimpleUploadedFile(
-            "big.png", buffer.read(), content_type="image/png"
+            "big.png", buffer.getvalue(), content_type="image/png"
         )
 
-        client.login(username="testuser", password=TEST_PASSWORD)
-        url = reverse(
-            "surveys:builder_question_image_upload",
-            kwargs={"slug": image_question.survey.slug, "qid": image_question.id},
+        client.force_login(survey_owner)
+        response = client.post(
+            upload_url, {"image": large_dim_image, "label": "Resized"}
         )
-        response = client.post(url, {"image": large_dim_image, "label": "Resized"})
         assert response.status_code == 200
 
         # Verify the image was created and resized
         question_img = image_question.images.first()
         assert question_img is not None
-        # Open and check dimensions
-        img = Image.open(question_img.image)
-        assert img.width <= 800
-        assert img.height <= 800
+        # Read the dimensions straight from the PNG's IHDR chunk
+        with question_img.image.open("rb") as f:
+            header = f.read(24)
+        assert header[:8] == b"\x89PNG\r\n\x1a\n"
+        width, height = struct.unpack(">II", header[16:24])
+        assert width <= 800
+        assert height <= 800
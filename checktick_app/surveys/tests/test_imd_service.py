@@ -2,12 +2,101 @@
 Tests for IMD (Index of Multiple Deprivation) service.
 """
 
-from unittest.mock import MagicMock, patch
+import io
+import json
+from urllib.parse import parse_qsl, urlsplit
 
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.db import DatabaseError
 from django.test import override_settings
+import pytest
+import requests
+from requests.adapters import BaseAdapter
 
+from checktick_app.surveys.models import PostcodeIMD
 from checktick_app.surveys.services.imd_service import IMDResult, IMDService
 
+API_URL = "https://api.example.com/imd"
+
+
+class _FakeIMDAdapter(BaseAdapter):
+    """
+    In-memory transport for the IMD API.
+
+    Mounted on the service's shared session, so requests go through the real
+    session and response handling without touching the network. Each test sets
+    ``status_code`` and ``body`` (a payload, raw bytes, or a callable taking the
+    request), or ``error`` to raise instead of responding.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.reset()
+
+    def reset(self):
+        self.status_code = 200
+        self.body = {}
+        self.error = None
+        self.calls = []
+        self.responses = []
+
+    def send(self, request, **kwargs):
+        self.calls.append((request, kwargs))
+        if self.error is not None:
+            raise self.error
+        body = self.body(request) if callable(self.body) else self.body
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode()
+
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.headers["Content-Type"] = "application/json"
+        response.raw = io.BytesIO(body)
+        response.url = request.url
+        response.request = request
+        self.responses.append(response)
+        return response
+
+    def close(self):
+        pass
+
+
+def _params(request):
+    """Query string parameters of a prepared request, as a dict."""
+    return dict(parse_qsl(urlsplit(request.url).query))
+
+
+@pytest.fixture(autouse=True)
+def clear_imd_cache():
+    """Each test starts with no cached IMD lookups."""
+    cache.clear()
+
+
+@pytest.fixture
+def imd_api_configured(settings):
+    """Point the service at the in-memory IMD API."""
+    settings.IMD_API_URL = API_URL
+    settings.IMD_API_KEY = "test-key"
+
+
+@pytest.fixture(scope="module")
+def mounted_imd_api():
+    """Mount the fake transport on the shared session once for the module."""
+    session = IMDService._session
+    original_adapters = session.adapters.copy()
+    adapter = _FakeIMDAdapter()
+    session.mount(API_URL, adapter)
+    yield adapter
+    session.adapters = original_adapters
+
+
+@pytest.fixture
+def imd_api(mounted_imd_api):
+    """The mounted fake transport, with recorded calls and replies reset."""
+    mounted_imd_api.reset()
+    return mounted_imd_api
+
 
 class TestIMDResult:
     """Tests for IMDResult dataclass."""
@@ -26,13 +115,19 @@ class TestIMDResult:
         )
         assert result.is_valid is False
 
+    def test_is_immutable(self):
+        from dataclasses import FrozenInstanceError
+
+        result = IMDResult(postcode="SW1A 1AA", imd_decile=5, imd_rank=12345)
+        with pytest.raises(FrozenInstanceError):
+            result.imd_decile = 6
+        assert not hasattr(result, "__dict__")
+
 
 class TestIMDServiceConfiguration:
     """Tests for IMDService configuration checks."""
 
-    @override_settings(
-        IMD_API_URL="https://api.example.com/imd", IMD_API_KEY="test-key"
-    )
+    @override_settings(IMD_API_URL=API_URL, IMD_API_KEY="test-key")
     def test_is_configured_returns_true_when_both_set(self):
         assert IMDService.is_configured() is True
 
@@ -40,23 +135,34 @@ class TestIMDServiceConfiguration:
     def test_is_configured_returns_false_when_url_empty(self):
         assert IMDService.is_configured() is False
 
-    @override_settings(IMD_API_URL="https://api.example.com/imd", IMD_API_KEY="")
+    @override_settings(IMD_API_URL=API_URL, IMD_API_KEY="")
     def test_is_configured_returns_false_when_key_empty(self):
         assert IMDService.is_configured() is False
 
+    def test_read_timeouts_are_not_retried(self):
+        """Only gateway errors and one failed connection are retried."""
+        retries = IMDService._session.get_adapter("https://").max_retries
 
-class TestIMDServiceLookup:
-    """Tests for IMDService.lookup_imd method."""
+        assert retries.read == 0
+        assert retries.connect == 1
+        assert retries.total == 2
+
+
+@pytest.mark.usefixtures("imd_api_configured")
+class TestIMDServiceLookupGuards:
+    """Tests for lookup_imd inputs rejected before the database or API."""
 
     def test_empty_postcode_returns_error(self):
         result = IMDService.lookup_imd("")
         assert result.is_valid is False
         assert result.error == "Empty postcode"
+        assert IMDService.lookup_imd("") is result
 
     def test_whitespace_only_postcode_returns_error(self):
         result = IMDService.lookup_imd("   ")
         assert result.is_valid is False
         assert result.error == "Empty postcode"
+        assert result.postcode == "   "
 
     @override_settings(IMD_API_URL="", IMD_API_KEY="")
     def test_returns_error_when_not_configured(self):
@@ -64,18 +170,14 @@ class TestIMDServiceLookup:
         assert result.is_valid is False
         assert result.error == "IMD API not configured"
 
-    @override_settings(
-        IMD_API_URL="https://api.example.com/imd", IMD_API_KEY="test-key"
-    )
-    @patch("checktick_app.surveys.services.imd_service.requests.get")
-    def test_successful_lookup_returns_decile(self, mock_get):
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "imd_decile": 7,
-            "imd_rank": 15234,
-        }
-        mock_get.return_value = mock_response
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("imd_api_configured")
+class TestIMDServiceLookup:
+    """Tests for IMDService.lookup_imd method."""
+
+    def test_successful_lookup_returns_decile(self, imd_api):
+        imd_api.body = {"imd_decile": 7, "imd_rank": 15234}
 
         result = IMDService.lookup_imd("SW1A 1AA")
 
@@ -85,26 +187,17 @@ class TestIMDServiceLookup:
         assert result.error is None
 
         # Verify API was called correctly
-        mock_get.assert_called_once()
-        call_args = mock_get.call_args
-        assert call_args[0][0] == "https://api.example.com/imd"
-        assert call_args[1]["params"]["postcode"] == "SW1A1AA"  # Spaces removed
-        assert call_args[1]["params"]["quantile"] == 10  # Default decile
-        assert call_args[1]["headers"]["Ocp-Apim-Subscription-Key"] == "test-key"
-
-    @override_settings(
-        IMD_API_URL="https://api.example.com/imd", IMD_API_KEY="test-key"
-    )
-    @patch("checktick_app.surveys.services.imd_service.requests.get")
-    def test_lookup_with_quantile_field_name(self, mock_get):
+        assert len(imd_api.calls) == 1
+        request, kwargs = imd_api.calls[0]
+        assert request.url.startswith(API_URL + "?")
+        assert _params(request)["postcode"] == "SW1A1AA"  # Spaces removed
+        assert _params(request)["quantile"] == "10"  # Default decile
+        assert request.headers["Ocp-Apim-Subscription-Key"] == "test-key"
+        assert kwargs["stream"] is True
+
+    def test_lookup_with_quantile_field_name(self, imd_api):
         """Test handling of API responses using 'quantile' instead of 'imd_decile'."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "quantile": 3,
-            "rank": 5000,
-        }
-        mock_get.return_value = mock_response
+        imd_api.body = {"quantile": 3, "rank": 5000}
 
         result = IMDService.lookup_imd("E1 6AN")
 
@@ -112,107 +205,194 @@ class TestIMDServiceLookup:
         assert result.imd_decile == 3
         assert result.imd_rank == 5000
 
-    @override_settings(
-        IMD_API_URL="https://api.example.com/imd", IMD_API_KEY="test-key"
+    @pytest.mark.parametrize(
+        "status_code, body, error, expected_error",
+        [
+            pytest.param(404, {}, None, "Postcode not found in IMD data", id="404"),
+            pytest.param(500, {}, None, "API error: 500", id="500"),
+            pytest.param(200, {}, requests.Timeout(), "API timeout", id="timeout"),
+            pytest.param(
+                200,
+                {},
+                requests.RequestException("Connection failed"),
+                "Request error",
+                id="request-exception",
+            ),
+            pytest.param(
+                200,
+                {"postcode": "SW1A1AA"},
+                None,
+                "No IMD data available",
+                id="no-decile",
+            ),
+        ],
     )
-    @patch("checktick_app.surveys.services.imd_service.requests.get")
-    def test_404_returns_not_found_error(self, mock_get):
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_get.return_value = mock_response
+    def test_error_paths_return_invalid_result(
+        self, imd_api, status_code, body, error, expected_error
+    ):
+        imd_api.status_code = status_code
+        imd_api.body = body
+        imd_api.error = error
 
-        result = IMDService.lookup_imd("INVALID")
+        result = IMDService.lookup_imd("SW1A 1AA")
 
         assert result.is_valid is False
-        assert result.error == "Postcode not found in IMD data"
+        assert expected_error in result.error
 
-    @override_settings(
-        IMD_API_URL="https://api.example.com/imd", IMD_API_KEY="test-key"
-    )
-    @patch("checktick_app.surveys.services.imd_service.requests.get")
-    def test_500_returns_api_error(self, mock_get):
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_get.return_value = mock_response
+    def test_error_response_closed_without_parsing(self, imd_api):
+        imd_api.status_code = 500
 
-        result = IMDService.lookup_imd("SW1A 1AA")
+        IMDService.lookup_imd("SW1A 1AA")
 
-        assert result.is_valid is False
-        assert "API error: 500" in result.error
+        (response,) = imd_api.responses
+        assert response.raw.closed
+        assert response._content_consumed is False
 
-    @override_settings(
-        IMD_API_URL="https://api.example.com/imd", IMD_API_KEY="test-key"
-    )
-    @patch("checktick_app.surveys.services.imd_service.requests.get")
-    def test_timeout_returns_error(self, mock_get):
-        import requests
+    def test_postcode_normalized(self, imd_api):
+        """Test that postcodes are normalized (spaces removed, uppercase)."""
+        imd_api.body = {"imd_decile": 5, "imd_rank": 10000}
 
-        mock_get.side_effect = requests.Timeout()
+        # Test with lowercase and spaces
+        IMDService.lookup_imd("sw1a  1aa")
 
-        result = IMDService.lookup_imd("SW1A 1AA")
+        request, _ = imd_api.calls[-1]
+        assert _params(request)["postcode"] == "SW1A1AA"
 
-        assert result.is_valid is False
-        assert result.error == "API timeout"
+    def test_custom_quantile(self, imd_api):
+        """Test custom quantile parameter (e.g., quintile)."""
+        imd_api.body = {"quantile": 2}
 
-    @override_settings(
-        IMD_API_URL="https://api.example.com/imd", IMD_API_KEY="test-key"
-    )
-    @patch("checktick_app.surveys.services.imd_service.requests.get")
-    def test_request_exception_returns_error(self, mock_get):
-        import requests
+        _ = IMDService.lookup_imd("SW1A 1AA", quantile=5)
+
+        request, _ = imd_api.calls[-1]
+        assert _params(request)["quantile"] == "5"
+
+    def test_repeat_lookup_served_from_cache(self, imd_api):
+        """Repeat lookups for the same postcode don't call the API again."""
+        imd_api.body = {"imd_decile": 4, "imd_rank": 9000}
+
+        first = IMDService.lookup_imd("SW1A 1AA")
+        second = IMDService.lookup_imd("sw1a1aa")
+
+        assert len(imd_api.calls) == 1
+        assert second.imd_decile == first.imd_decile == 4
+        assert second.imd_rank == 9000
+        assert second.postcode == "sw1a1aa"
+
+    def test_successful_lookup_is_stored(self, imd_api):
+        imd_api.body = {"imd_decile": 3, "imd_rank": 4000}
 
-        mock_get.side_effect = requests.RequestException("Connection failed")
+        IMDService.lookup_imd("SW1A 1AA")
+
+        stored = PostcodeIMD.objects.get(postcode="SW1A1AA", quantile=10)
+        assert stored.imd_decile == 3
+        assert stored.imd_rank == 4000
+
+    def test_stored_postcode_skips_api(self, imd_api):
+        PostcodeIMD.objects.create(
+            postcode="E16AN", quantile=10, imd_decile=2, imd_rank=1500
+        )
+
+        result = IMDService.lookup_imd("e1 6an")
+
+        assert imd_api.calls == []
+        assert result.is_valid is True
+        assert result.imd_decile == 2
+        assert result.imd_rank == 1500
+
+    def test_store_failure_still_returns_result(self, imd_api, monkeypatch):
+        """A database error while storing only skips the stored shortcut."""
+        imd_api.body = {"imd_decile": 3, "imd_rank": 4000}
+
+        def fail(*args, **kwargs):
+            raise DatabaseError("table unavailable")
+
+        monkeypatch.setattr(PostcodeIMD.objects, "bulk_create", fail)
 
         result = IMDService.lookup_imd("SW1A 1AA")
 
-        assert result.is_valid is False
-        assert "Request error" in result.error
+        assert result.is_valid is True
+        assert result.imd_decile == 3
+        assert result.imd_rank == 4000
 
-    @override_settings(
-        IMD_API_URL="https://api.example.com/imd", IMD_API_KEY="test-key"
-    )
-    @patch("checktick_app.surveys.services.imd_service.requests.get")
-    def test_postcode_normalized(self, mock_get):
-        """Test that postcodes are normalized (spaces removed, uppercase)."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"imd_decile": 5, "imd_rank": 10000}
-        mock_get.return_value = mock_response
+    def test_postcode_too_long_to_store_still_returns_result(self, imd_api):
+        """Postcodes longer than the PostcodeIMD column are not stored."""
+        imd_api.body = {"imd_decile": 5, "imd_rank": 7000}
 
-        # Test with lowercase and spaces
-        IMDService.lookup_imd("sw1a  1aa")
+        result = IMDService.lookup_imd("ABCDE FGHIJK")
 
-        call_args = mock_get.call_args
-        assert call_args[1]["params"]["postcode"] == "SW1A1AA"
+        assert result.is_valid is True
+        assert result.imd_decile == 5
+        assert not PostcodeIMD.objects.filter(postcode="ABCDEFGHIJK").exists()
 
-    @override_settings(
-        IMD_API_URL="https://api.example.com/imd", IMD_API_KEY="test-key"
-    )
-    @patch("checktick_app.surveys.services.imd_service.requests.get")
-    def test_custom_quantile(self, mock_get):
-        """Test custom quantile parameter (e.g., quintile)."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"quantile": 2}
-        mock_get.return_value = mock_response
+    def test_errors_are_not_cached(self, imd_api):
+        imd_api.status_code = 500
 
-        _ = IMDService.lookup_imd("SW1A 1AA", quantile=5)
+        IMDService.lookup_imd("SW1A 1AA")
+        IMDService.lookup_imd("SW1A 1AA")
 
-        call_args = mock_get.call_args
-        assert call_args[1]["params"]["quantile"] == 5
+        assert len(imd_api.calls) == 2
 
-    @override_settings(
-        IMD_API_URL="https://api.example.com/imd", IMD_API_KEY="test-key"
-    )
-    @patch("checktick_app.surveys.services.imd_service.requests.get")
-    def test_response_without_decile_data(self, mock_get):
-        """Test handling of responses that don't include decile data."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"postcode": "SW1A1AA"}  # No decile
-        mock_get.return_value = mock_response
+    def test_malformed_json_returns_error(self, imd_api):
+        """A 200 response with an unparseable body is reported, not raised."""
+        imd_api.body = b"<html>"
 
         result = IMDService.lookup_imd("SW1A 1AA")
 
         assert result.is_valid is False
-        assert "No IMD data available" in result.error
+        assert "Invalid API response" in result.error
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("imd_api_configured")
+class TestIMDServiceBulkLookup:
+    """Tests for IMDService.lookup_imd_bulk method."""
+
+    def test_empty_list_returns_empty(self):
+        assert IMDService.lookup_imd_bulk([]) == []
+
+    def test_only_unstored_postcodes_hit_api(self, imd_api):
+        PostcodeIMD.objects.create(postcode="E16AN", quantile=10, imd_decile=2)
+        imd_api.body = {"imd_decile": 8}
+
+        results = IMDService.lookup_imd_bulk(["E1 6AN", "SW1A 1AA"])
+
+        assert len(imd_api.calls) == 1
+        assert _params(imd_api.calls[0][0])["postcode"] == "SW1A1AA"
+        assert [r.imd_decile for r in results] == [2, 8]
+        assert PostcodeIMD.objects.filter(postcode="SW1A1AA").exists()
+
+    def test_results_preserve_input_order(self, imd_api):
+        deciles = {"SW1A1AA": 8, "E16AN": 2}
+        imd_api.body = lambda request: {
+            "imd_decile": deciles[_params(request)["postcode"]]
+        }
+
+        results = IMDService.lookup_imd_bulk(["E1 6AN", "SW1A 1AA"])
+
+        assert [r.postcode for r in results] == ["E1 6AN", "SW1A 1AA"]
+        assert [r.imd_decile for r in results] == [2, 8]
+
+    def test_duplicate_postcodes_looked_up_once(self, imd_api):
+        imd_api.body = {"imd_decile": 6}
+
+        results = IMDService.lookup_imd_bulk(["SW1A 1AA", "sw1a1aa", "SW1A1AA "])
+
+        assert len(imd_api.calls) == 1
+        assert [r.postcode for r in results] == ["SW1A 1AA", "sw1a1aa", "SW1A1AA "]
+        assert all(r.imd_decile == 6 for r in results)
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("imd_api_configured")
+class TestIMDServiceAsyncLookup:
+    """Tests for IMDService.lookup_imd_async method."""
+
+    def test_async_lookup_returns_decile(self, imd_api):
+        imd_api.body = {"imd_decile": 9, "imd_rank": 30000}
+
+        result = async_to_sync(IMDService.lookup_imd_async)("SW1A 1AA", quantile=5)
+
+        assert result.is_valid is True
+        assert result.imd_decile == 9
+        assert _params(imd_api.calls[-1][0])["quantile"] == "5"
@@ -6,35 +6,44 @@ and emergency platform recovery.
 """
 
 from io import StringIO
+from itertools import combinations
+import re
 import secrets
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
 from django.core.management import CommandError, call_command
-from django.test import TestCase
 import pytest
 
+from checktick_app.surveys.management.commands import execute_platform_recovery
 from checktick_app.surveys.models import RecoveryRequest, Survey
 from checktick_app.surveys.shamir import reconstruct_secret, split_secret
 
 User = get_user_model()
 
-# Use consistent test password constant
-TEST_PASSWORD = "x"
+# A custodian component and its default 3-of-4 split, made once and shared by
+# every test that just needs a valid component or valid shares
+COMPONENT = secrets.token_bytes(64)
+COMPONENT_HEX = COMPONENT.hex()
+SHARES = split_secret(COMPONENT, threshold=3, total_shares=4)
 
+# split_custodian_component prints each share on the line after "Share N:"
+_SHARE_RE = re.compile(r"^Share \d+:\n\s*(80\d+-\d+-[0-9a-f]+)$", re.MULTILINE)
 
-class TestSplitCustodianComponentCommand(TestCase):
+
+def _extract_shares(output: str) -> list[str]:
+    """Extract share strings from command output."""
+    return _SHARE_RE.findall(output)
+
+
+class TestSplitCustodianComponentCommand:
     """Test the split_custodian_component management command."""
 
     def test_split_command_with_valid_component(self):
         """Test splitting a valid 64-byte custodian component."""
-        # Generate a valid 64-byte custodian component
-        component = secrets.token_bytes(64)
-        component_hex = component.hex()
-
         out = StringIO()
         call_command(
-            "split_custodian_component", custodian_component=component_hex, stdout=out
+            "split_custodian_component", custodian_component=COMPONENT_HEX, stdout=out
         )
 
         output = out.getvalue()
@@ -45,30 +54,27 @@ class TestSplitCustodianComponentCommand(TestCase):
         assert "need 3 to reconstruct" in output
 
         # Extract shares from output
-        shares = self._extract_shares(output)
+        shares = _extract_shares(output)
         assert len(shares) == 4
 
         # Verify shares can reconstruct the original
         reconstructed = reconstruct_secret(shares[:3])
-        assert reconstructed == component
+        assert reconstructed == COMPONENT
 
     def test_split_command_with_custom_thresholds(self):
         """Test splitting with different threshold configurations."""
-        component = secrets.token_bytes(64)
-        component_hex = component.hex()
-
         # Test 5 shares with 3 required
         out = StringIO()
         call_command(
             "split_custodian_component",
-            custodian_component=component_hex,
+            custodian_component=COMPONENT_HEX,
             shares=5,
             threshold=3,
             stdout=out,
         )
 
         output = out.getvalue()
-        shares = self._extract_shares(output)
+        shares = _extract_shares(output)
         assert len(shares) == 5
         assert "5 shares" in output
 
@@ -91,12 +97,9 @@ class TestSplitCustodianComponentCommand(TestCase):
 
     def test_split_command_default_parameters(self):
         """Test command with default shares and threshold."""
-        component = secrets.token_bytes(64)
-        component_hex = component.hex()
-
         out = StringIO()
         call_command(
-            "split_custodian_component", custodian_component=component_hex, stdout=out
+            "split_custodian_component", custodian_component=COMPONENT_HEX, stdout=out
         )
 
         output = out.getvalue()
@@ -105,38 +108,19 @@ class TestSplitCustodianComponentCommand(TestCase):
         assert "4 shares" in output
         assert "need 3 to reconstruct" in output
 
-    def _extract_shares(self, output: str) -> list[str]:
-        """Extract share strings from command output."""
-        shares = []
-        lines = output.split("\n")
-        for i, line in enumerate(lines):
-            # Look for "Share N:" pattern, then get next line which contains the actual share
-            if line.strip().startswith("Share ") and ":" in line.strip():
-                # Get next non-empty line which should contain the share
-                for j in range(i + 1, min(i + 3, len(lines))):
-                    next_line = lines[j].strip()
-                    if next_line and next_line.startswith("80") and "-" in next_line:
-                        shares.append(next_line)
-                        break
-        return shares
-
-
-class TestCustodianReconstructionCommand(TestCase):
+
+class TestCustodianReconstructionCommand:
     """Test the test_custodian_reconstruction management command."""
 
     def test_reconstruction_with_valid_shares(self):
         """Test reconstructing custodian component from valid shares."""
-        # Create a custodian component and split it
-        original_component = secrets.token_bytes(64)
-        shares = split_secret(original_component, threshold=3, total_shares=4)
-
         # Test reconstruction
         out = StringIO()
         call_command(
             "test_custodian_reconstruction",
-            share_1=shares[0],
-            share_2=shares[1],
-            share_3=shares[2],
+            share_1=SHARES[0],
+            share_2=SHARES[1],
+            share_3=SHARES[2],
             stdout=out,
         )
 
@@ -145,20 +129,17 @@ class TestCustodianReconstructionCommand(TestCase):
         # Verify output
         assert "Testing Custodian Component Reconstruction" in output
         assert "Reconstructing from shares" in output
-        assert original_component.hex() in output
+        assert COMPONENT_HEX in output
 
     def test_reconstruction_with_original_validation(self):
         """Test reconstruction with original component validation."""
-        original_component = secrets.token_bytes(64)
-        shares = split_secret(original_component, threshold=3, total_shares=4)
-
         out = StringIO()
         call_command(
             "test_custodian_reconstruction",
-            share_1=shares[0],
-            share_2=shares[1],
-            share_3=shares[2],
-            original=original_component.hex(),
+            share_1=SHARES[0],
+            share_2=SHARES[1],
+            share_3=SHARES[2],
+            original=COMPONENT_HEX,
             stdout=out,
         )
 
@@ -170,33 +151,28 @@ class TestCustodianReconstructionCommand(TestCase):
 
     def test_reconstruction_with_wrong_original(self):
         """Test reconstruction shows failure when original doesn't match."""
-        original_component = secrets.token_bytes(64)
         wrong_component = secrets.token_bytes(64)
-        shares = split_secret(original_component, threshold=3, total_shares=4)
 
         # Command should raise an error when verification fails
         with pytest.raises(CommandError, match="(Reconstruction|verification)"):
             call_command(
                 "test_custodian_reconstruction",
-                share_1=shares[0],
-                share_2=shares[1],
-                share_3=shares[2],
+                share_1=SHARES[0],
+                share_2=SHARES[1],
+                share_3=SHARES[2],
                 original=wrong_component.hex(),
                 stdout=StringIO(),
             )
 
     def test_reconstruction_with_all_four_shares(self):
         """Test that reconstruction works with all 4 shares."""
-        original_component = secrets.token_bytes(64)
-        shares = split_secret(original_component, threshold=3, total_shares=4)
-
         # Use shares 0, 1, and 3 (skipping 2)
         out = StringIO()
         call_command(
             "test_custodian_reconstruction",
-            share_1=shares[0],
-            share_2=shares[1],
-            share_3=shares[3],
+            share_1=SHARES[0],
+            share_2=SHARES[1],
+            share_3=SHARES[3],
             stdout=out,
         )
 
@@ -204,47 +180,54 @@ class TestCustodianReconstructionCommand(TestCase):
 
         # Should work
         assert "✓ Reconstruction successful" in output
-        assert original_component.hex() in output
+        assert COMPONENT_HEX in output
 
     def test_reconstruction_with_insufficient_shares(self):
         """Test that reconstruction with invalid shares fails."""
-        original_component = secrets.token_bytes(64)
-        shares = split_secret(original_component, threshold=3, total_shares=4)
-
         # Try with an invalid third share
         with pytest.raises(CommandError):
             call_command(
                 "test_custodian_reconstruction",
                 **{
-                    "share_1": shares[0],
-                    "share_2": shares[1],
+                    "share_1": SHARES[0],
+                    "share_2": SHARES[1],
                     "share_3": "invalid-share",
                 },
             )
 
 
-@pytest.mark.django_db
-class TestExecutePlatformRecoveryCommand:
-    """Test the execute_platform_recovery management command."""
+@pytest.fixture(scope="module")
+def recovery_fixtures(module_db, django_db_blocker):
+    """
+    A user, a superuser and a survey, created once for the module.
 
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        """Set up test fixtures."""
-        self.user = User.objects.create_user(
+    Nobody logs in, so the users get unusable passwords and nothing is hashed.
+    """
+    with django_db_blocker.unblock():
+        user = User.objects.create_user(
             username="testuser",
             email="test@example.com",
-            password=TEST_PASSWORD,
         )
-        self.admin = User.objects.create_superuser(
+        admin = User.objects.create_superuser(
             username="admin",
             email="admin@example.com",
-            password=TEST_PASSWORD,
         )
-        self.survey = Survey.objects.create(
+        survey = Survey.objects.create(
             name="Test Survey",
             slug="test-survey",
-            owner=self.user,
+            owner=user,
         )
+    return user, admin, survey
+
+
+@pytest.mark.django_db
+class TestExecutePlatformRecoveryCommand:
+    """Test the execute_platform_recovery management command."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, recovery_fixtures):
+        """Set up test fixtures."""
+        self.user, self.admin, self.survey = recovery_fixtures
 
     def test_recovery_command_with_valid_request(self):
         """Test platform recovery with valid recovery request."""
@@ -257,42 +240,33 @@ class TestExecutePlatformRecoveryCommand:
             secondary_approver=self.admin,  # In testing, same admin is OK
         )
 
-        # Generate custodian component and shares
-        custodian_component = secrets.token_bytes(64)
-        shares = split_secret(custodian_component, threshold=3, total_shares=4)
-
-        # Mock the vault client
-        with patch(
-            "checktick_app.surveys.management.commands.execute_platform_recovery.get_vault_client"
-        ) as mock_vault_func:
-            mock_vault = MagicMock()
-            mock_vault_func.return_value = mock_vault
-
+        # A dry run must stop before it reaches Vault
+        with patch.object(
+            execute_platform_recovery, "get_vault_client", autospec=True
+        ) as mock_get_vault_client:
             out = StringIO()
             call_command(
                 "execute_platform_recovery",
                 str(recovery_request.id),
                 **{
-                    "custodian_share_1": shares[0],
-                    "custodian_share_2": shares[1],
-                    "custodian_share_3": shares[2],
+                    "custodian_share_1": SHARES[0],
+                    "custodian_share_2": SHARES[1],
+                    "custodian_share_3": SHARES[2],
                 },
                 executor="admin@example.com",  # Required executor email
                 dry_run=True,  # Don't actually execute recovery in test
                 stdout=out,
             )
 
-            output = out.getvalue()
+        mock_get_vault_client.assert_not_called()
+        output = out.getvalue()
 
-            # Verify output
-            assert "Platform Recovery Execution" in output
-            assert recovery_request.request_code in output
+        # Verify output
+        assert "Platform Recovery Execution" in output
+        assert recovery_request.request_code in output
 
     def test_recovery_command_missing_recovery_request(self):
         """Test that command fails when recovery request doesn't exist."""
-        custodian_component = secrets.token_bytes(64)
-        shares = split_secret(custodian_component, threshold=3, total_shares=4)
-
         # Use a valid UUID that doesn't exist
         import uuid
 
@@ -301,9 +275,9 @@ class TestExecutePlatformRecoveryCommand:
                 "execute_platform_recovery",
                 str(uuid.uuid4()),  # Valid UUID format but doesn't exist
                 **{
-                    "custodian_share_1": shares[0],
-                    "custodian_share_2": shares[1],
-                    "custodian_share_3": shares[2],
+                    "custodian_share_1": SHARES[0],
+                    "custodian_share_2": SHARES[1],
+                    "custodian_share_3": SHARES[2],
                 },
             )
 
@@ -315,9 +289,6 @@ class TestExecutePlatformRecoveryCommand:
             status=RecoveryRequest.Status.COMPLETED,  # Wrong status
         )
 
-        custodian_component = secrets.token_bytes(64)
-        shares = split_secret(custodian_component, threshold=3, total_shares=4)
-
         with pytest.raises(
             CommandError, match="(already been completed|not ready|COMPLETED)"
         ):
@@ -325,9 +296,9 @@ class TestExecutePlatformRecoveryCommand:
                 "execute_platform_recovery",
                 str(recovery_request.id),
                 **{
-                    "custodian_share_1": shares[0],
-                    "custodian_share_2": shares[1],
-                    "custodian_share_3": shares[2],
+                    "custodian_share_1": SHARES[0],
+                    "custodian_share_2": SHARES[1],
+                    "custodian_share_3": SHARES[2],
                 },
             )
 
@@ -339,42 +310,36 @@ class TestExecutePlatformRecoveryCommand:
             status=RecoveryRequest.Status.READY_FOR_EXECUTION,
         )
 
-        custodian_component = secrets.token_bytes(64)
-        shares = split_secret(custodian_component, threshold=3, total_shares=4)
-
         # Try with invalid third share
         with pytest.raises(CommandError):
             call_command(
                 "execute_platform_recovery",
                 str(recovery_request.id),
                 **{
-                    "custodian_share_1": shares[0],
-                    "custodian_share_2": shares[1],
+                    "custodian_share_1": SHARES[0],
+                    "custodian_share_2": SHARES[1],
                     "custodian_share_3": "invalid-share",
                 },
             )
 
 
-class TestCommandIntegration(TestCase):
+class TestCommandIntegration:
     """Integration tests for command workflows."""
 
     def test_split_and_verify_workflow(self):
         """Test the complete split → verify workflow."""
         # Step 1: Split a custodian component
-        custodian_component = secrets.token_bytes(64)
-        component_hex = custodian_component.hex()
-
         split_out = StringIO()
         call_command(
             "split_custodian_component",
-            custodian_component=component_hex,
+            custodian_component=COMPONENT_HEX,
             stdout=split_out,
         )
 
         split_output = split_out.getvalue()
 
         # Extract shares from output
-        shares = self._extract_shares(split_output)
+        shares = _extract_shares(split_output)
         assert len(shares) == 4
 
         # Step 2: Verify the shares reconstruct correctly
@@ -384,7 +349,7 @@ class TestCommandIntegration(TestCase):
             share_1=shares[0],
             share_2=shares[1],
             share_3=shares[2],
-            original=component_hex,
+            original=COMPONENT_HEX,
             stdout=verify_out,
         )
 
@@ -393,69 +358,46 @@ class TestCommandIntegration(TestCase):
         # Should show success
         assert "✓ Match verified" in verify_output or "matches" in verify_output.lower()
 
-    def test_different_share_combinations(self):
+    @pytest.mark.parametrize(
+        "combo",
+        list(combinations(range(4), 3)),
+        ids=lambda combo: "shares-" + "".join(str(i + 1) for i in combo),
+    )
+    def test_different_share_combinations(self, combo):
         """Test that any 3 of 4 shares work for reconstruction."""
-        custodian_component = secrets.token_bytes(64)
-        component_hex = custodian_component.hex()
-
-        shares = split_secret(custodian_component, threshold=3, total_shares=4)
+        share_1, share_2, share_3 = (SHARES[i] for i in combo)
 
-        # Test all combinations of 3 shares
-        combinations = [
-            [shares[0], shares[1], shares[2]],
-            [shares[0], shares[1], shares[3]],
-            [shares[0], shares[2], shares[3]],
-            [shares[1], shares[2], shares[3]],
-        ]
-
-        for combo in combinations:
-            verify_out = StringIO()
-            call_command(
-                "test_custodian_reconstruction",
-                share_1=combo[0],
-                share_2=combo[1],
-                share_3=combo[2],
-                original=component_hex,
-                stdout=verify_out,
-            )
-
-            verify_output = verify_out.getvalue()
-            assert "✓" in verify_output or "success" in verify_output.lower()
+        verify_out = StringIO()
+        call_command(
+            "test_custodian_reconstruction",
+            share_1=share_1,
+            share_2=share_2,
+            share_3=share_3,
+            original=COMPONENT_HEX,
+            stdout=verify_out,
+        )
 
-    def _extract_shares(self, output: str) -> list[str]:
-        """Extract share strings from command output."""
-        shares = []
-        lines = output.split("\n")
-        for i, line in enumerate(lines):
-            if line.strip().startswith("Share ") and ":" in line.strip():
-                for j in range(i + 1, min(i + 3, len(lines))):
-                    next_line = lines[j].strip()
-                    if next_line and next_line.startswith("80") and "-" in next_line:
-                        shares.append(next_line)
-                        break
-        return shares
+        verify_output = verify_out.getvalue()
+        assert "✓" in verify_output or "success" in verify_output.lower()
 
 
-class TestCommandSecurityProperties(TestCase):
+class TestCommandSecurityProperties:
     """Test security properties of the commands."""
 
     def test_shares_are_different_each_time(self):
         """Test that splitting the same component twice produces different shares."""
-        custodian_component = secrets.token_bytes(64)
-        component_hex = custodian_component.hex()
-
         # Split twice
         out1 = StringIO()
         call_command(
             "split_custodian_component",
-            custodian_component=component_hex,
+            custodian_component=COMPONENT_HEX,
             stdout=out1,
         )
 
         out2 = StringIO()
         call_command(
             "split_custodian_component",
-            custodian_component=component_hex,
+            custodian_component=COMPONENT_HEX,
             stdout=out2,
         )
 
@@ -464,13 +406,10 @@ class TestCommandSecurityProperties(TestCase):
 
     def test_command_output_includes_security_warnings(self):
         """Test that commands include appropriate security warnings."""
-        custodian_component = secrets.token_bytes(64)
-        component_hex = custodian_component.hex()
-
         out = StringIO()
         call_command(
             "split_custodian_component",
-            custodian_component=component_hex,
+            custodian_component=COMPONENT_HEX,
             stdout=out,
         )
 
@@ -482,15 +421,12 @@ class TestCommandSecurityProperties(TestCase):
 
     def test_reconstruction_shows_result(self):
         """Test that reconstruction command displays result appropriately."""
-        custodian_component = secrets.token_bytes(64)
-        shares = split_secret(custodian_component, threshold=3, total_shares=4)
-
         out = StringIO()
         call_command(
             "test_custodian_reconstruction",
-            share_1=shares[0],
-            share_2=shares[1],
-            share_3=shares[2],
+            share_1=SHARES[0],
+            share_2=SHARES[1],
+            share_3=SHARES[2],
             stdout=out,
         )
 
@@ -498,4 +434,4 @@ class TestCommandSecurityProperties(TestCase):
 
         # Should show the reconstructed component (admin needs to verify)
         assert "Reconstructed custodian component" in output
-        assert custodian_component.hex() in output
+        assert COMPONENT_HEX in output
@@ -3,83 +3,36 @@ Tests for the process_recovery_time_delays management command.
 """
 
 from datetime import timedelta
-from io import StringIO
+from io import StringIO, TextIOBase
 from unittest.mock import patch
 
-from django.contrib.auth import get_user_model
 from django.core.management import call_command
 from django.utils import timezone
 import pytest
 
-from checktick_app.surveys.models import (
-    Organization,
-    OrganizationMembership,
-    RecoveryRequest,
-    Survey,
+from checktick_app.surveys.management.commands.process_recovery_time_delays import (
+    Command as ProcessTimeDelaysCommand,
 )
+from checktick_app.surveys.models import RecoveryRequest, Survey
 
-User = get_user_model()
-TEST_PASSWORD = "x"
 
+class _NullIO(TextIOBase):
+    """Stdout for commands whose output a test doesn't check; discards writes."""
 
-@pytest.fixture
-def org_owner(db):
-    """Organization owner user."""
-    return User.objects.create_user(
-        username="orgowner",
-        email="orgowner@example.com",
-        password=TEST_PASSWORD,
-    )
-
-
-@pytest.fixture
-def org_admin(db):
-    """Organization admin user."""
-    return User.objects.create_user(
-        username="orgadmin",
-        email="orgadmin@example.com",
-        password=TEST_PASSWORD,
-    )
-
-
-@pytest.fixture
-def regular_user(db):
-    """Regular user who owns surveys."""
-    return User.objects.create_user(
-        username="regular",
-        email="regular@example.com",
-        password=TEST_PASSWORD,
-    )
-
-
-@pytest.fixture
-def organization(db, org_owner):
-    """Test organization."""
-    return Organization.objects.create(
-        name="Test Organization",
-        owner=org_owner,
-    )
-
-
-@pytest.fixture
-def org_admin_membership(db, organization, org_admin):
-    """Make org_admin an admin of the organization."""
-    return OrganizationMembership.objects.create(
-        organization=organization,
-        user=org_admin,
-        role=OrganizationMembership.Role.ADMIN,
-    )
+    def write(self, s):
+        return len(s)
 
 
-@pytest.fixture
-def survey(db, regular_user, organization):
-    """Survey owned by regular_user in organization."""
-    return Survey.objects.create(
-        name="Test Survey",
-        slug="test-survey-main",
-        owner=regular_user,
-        organization=organization,
-    )
+@pytest.fixture(scope="module")
+def survey(regular_user, organization, django_db_blocker):
+    """Survey owned by regular_user in organization, created once per module."""
+    with django_db_blocker.unblock():
+        return Survey.objects.create(
+            name="Test Survey",
+            slug="test-survey-main",
+            owner=regular_user,
+            organization=organization,
+        )
 
 
 @pytest.fixture
@@ -175,43 +128,66 @@ class TestProcessRecoveryTimeDelays:
         assert "DRY RUN" in output
         assert "Would process 1" in output
 
+    @pytest.mark.parametrize("extra", [1, 5])
     def test_processes_multiple_expired_requests(
-        self, expired_recovery_request, regular_user, survey, org_owner, org_admin
+        self,
+        expired_recovery_request,
+        regular_user,
+        survey,
+        org_owner,
+        org_admin,
+        extra,
     ):
         """Command processes multiple expired requests."""
-        # Create second expired request
-        survey2 = Survey.objects.create(
-            name="Test Survey 3",
-            slug="test-survey-3-multi",
-            owner=regular_user,
-            organization=survey.organization,
+        # Further requests are inserted already approved and past their
+        # delay, each on its own survey
+        surveys = Survey.objects.bulk_create(
+            [
+                Survey(
+                    name=f"Test Survey {i + 3}",
+                    slug=f"test-survey-{i + 3}-multi",
+                    owner=regular_user,
+                    organization=survey.organization,
+                )
+                for i in range(extra)
+            ]
         )
-        request2 = RecoveryRequest.objects.create(
-            user=regular_user,
-            survey=survey2,
-            status=RecoveryRequest.Status.AWAITING_PRIMARY,
-            time_delay_hours=24,
+        now = timezone.now()
+        others = RecoveryRequest.objects.bulk_create(
+            [
+                RecoveryRequest(
+                    # bulk_create skips save(), which generates the code
+                    request_code=f"MUL-{i:03d}-REQ",
+                    user=regular_user,
+                    survey=other_survey,
+                    status=RecoveryRequest.Status.IN_TIME_DELAY,
+                    time_delay_hours=24,
+                    primary_approver=org_owner,
+                    primary_approved_at=now,
+                    secondary_approver=org_admin,
+                    secondary_approved_at=now,
+                    approved_at=now,
+                    time_delay_until=now - timedelta(hours=2),
+                )
+                for i, other_survey in enumerate(surveys)
+            ]
         )
-        request2.approve_primary(admin=org_owner, reason="Approved")
-        request2.approve_secondary(admin=org_admin, reason="Approved")
-        request2.time_delay_until = timezone.now() - timedelta(hours=2)
-        request2.save(update_fields=["time_delay_until"])
+        total = extra + 1
 
         out = StringIO()
         call_command("process_recovery_time_delays", "--verbose", stdout=out)
 
-        expired_recovery_request.refresh_from_db()
-        request2.refresh_from_db()
-
+        ids = [expired_recovery_request.pk, *(request.pk for request in others)]
         assert (
-            expired_recovery_request.status
-            == RecoveryRequest.Status.READY_FOR_EXECUTION
+            RecoveryRequest.objects.filter(
+                pk__in=ids, status=RecoveryRequest.Status.READY_FOR_EXECUTION
+            ).count()
+            == total
         )
-        assert request2.status == RecoveryRequest.Status.READY_FOR_EXECUTION
 
         output = out.getvalue()
-        assert "Found 2 recovery request" in output
-        assert "Processed 2" in output
+        assert f"Found {total} recovery request" in output
+        assert f"Processed {total}" in output
 
     def test_ignores_non_time_delay_statuses(self, regular_user, survey):
         """Command ignores requests not in IN_TIME_DELAY status."""
@@ -235,22 +211,32 @@ class TestProcessRecoveryTimeDelays:
         """Processing creates an audit entry."""
         initial_count = expired_recovery_request.audit_entries.count()
 
-        call_command("process_recovery_time_delays")
+        call_command("process_recovery_time_delays", stdout=_NullIO())
 
-        expired_recovery_request.refresh_from_db()
-        assert expired_recovery_request.audit_entries.count() > initial_count
+        entries = list(expired_recovery_request.audit_entries.order_by("-timestamp"))
+        assert len(entries) > initial_count
+        assert entries[0].event_type == "time_delay_complete"
+
+    def test_audit_entry_is_hash_chained(self, expired_recovery_request):
+        """Bulk-created audit entries still get tamper-detection hashes."""
+        previous_entry = expired_recovery_request.audit_entries.order_by(
+            "-timestamp"
+        ).first()
+
+        call_command("process_recovery_time_delays", stdout=_NullIO())
 
         latest_entry = expired_recovery_request.audit_entries.order_by(
             "-timestamp"
         ).first()
         assert latest_entry.event_type == "time_delay_complete"
+        assert latest_entry.actor_type == "system"
+        assert len(latest_entry.entry_hash) == 64
+        assert latest_entry.previous_hash == previous_entry.entry_hash
 
-    @patch(
-        "checktick_app.surveys.management.commands.process_recovery_time_delays.Command._send_ready_notification"
-    )
+    @patch.object(ProcessTimeDelaysCommand, "_send_ready_notification")
     def test_sends_notification(self, mock_send, expired_recovery_request):
         """Processing sends notification email."""
-        call_command("process_recovery_time_delays", "--verbose")
+        call_command("process_recovery_time_delays", "--verbose", stdout=_NullIO())
 
         mock_send.assert_called_once()
         call_args = mock_send.call_args
@@ -258,13 +244,13 @@ class TestProcessRecoveryTimeDelays:
 
     def test_handles_notification_error_gracefully(self, expired_recovery_request):
         """Command handles notification errors without failing."""
-        with patch(
-            "checktick_app.surveys.management.commands.process_recovery_time_delays.Command._send_ready_notification",
+        with patch.object(
+            ProcessTimeDelaysCommand,
+            "_send_ready_notification",
             side_effect=Exception("Email failed"),
         ):
-            out = StringIO()
             # Should not raise
-            call_command("process_recovery_time_delays", "--verbose", stdout=out)
+            call_command("process_recovery_time_delays", "--verbose", stdout=_NullIO())
 
             # Request should still be updated
             expired_recovery_request.refresh_from_db()
@@ -12,12 +12,17 @@ Tests cover:
 """
 
 from datetime import timedelta
+import json
 
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 import pytest
 
+from checktick_app.surveys import views
 from checktick_app.surveys.management.commands.cleanup_survey_progress import (
     Command as CleanupCommand,
 )
@@ -29,9 +34,33 @@ from checktick_app.surveys.models import (
     SurveyQuestion,
 )
 
-TEST_PASSWORD = "x"
 User = get_user_model()
 
+# The slugs match the published_survey and public_survey fixtures below
+PUBLISHED_SURVEY_URL = reverse("surveys:take", kwargs={"slug": "test-survey"})
+PUBLIC_SURVEY_URL = reverse("surveys:take", kwargs={"slug": "public-survey"})
+
+# Queries to render the three-question published survey with saved progress,
+# pinned to the measured count. The page's branching config still looks
+# conditions up per question (two queries each), so one more per-question
+# lookup fails this rather than fitting under a looser ceiling.
+TAKE_PAGE_MAX_QUERIES = 36
+
+pytestmark = pytest.mark.usefixtures("fast_password_hasher", "cache_sessions")
+
+
+@pytest.fixture(scope="module")
+def cache_sessions():
+    """
+    Keep sessions in the (local-memory) cache rather than the database.
+
+    SESSION_SAVE_EVERY_REQUEST is on, so database sessions cost a read and a
+    write on every request. Signed cookies won't do here: anonymous progress
+    is keyed on the session key, which has to stay the same between requests.
+    """
+    with override_settings(SESSION_ENGINE="django.contrib.sessions.backends.cache"):
+        yield
+
 
 @pytest.fixture(autouse=True)
 def disable_rate_limiting(settings):
@@ -39,139 +68,147 @@ def disable_rate_limiting(settings):
     settings.RATELIMIT_ENABLE = False
 
 
-@pytest.fixture
-def survey_owner(django_user_model):
-    """Create a survey owner user."""
-    return django_user_model.objects.create_user(
-        username="owner@example.com", password=TEST_PASSWORD
-    )
-
-
-@pytest.fixture
-def participant(django_user_model):
-    """Create a participant user."""
-    return django_user_model.objects.create_user(
-        username="participant@example.com", password=TEST_PASSWORD
-    )
-
-
-@pytest.fixture
-def another_participant(django_user_model):
-    """Create another participant user."""
-    return django_user_model.objects.create_user(
-        username="another@example.com", password=TEST_PASSWORD
-    )
-
-
-@pytest.fixture
-def test_organization(survey_owner):
-    """Create a test organization."""
-    return Organization.objects.create(
-        name="Test Organization",
-        owner=survey_owner,
-    )
-
-
-@pytest.fixture
-def published_survey(survey_owner, test_organization):
-    """Create a published survey with multiple questions."""
-    survey = Survey.objects.create(
-        owner=survey_owner,
-        name="Test Survey",
-        slug="test-survey",
-        status=Survey.Status.PUBLISHED,
-        visibility=Survey.Visibility.AUTHENTICATED,
-        allow_any_authenticated=True,  # Allow any authenticated user for testing
-        organization=test_organization,
-    )
-
-    # Add multiple questions - IDs will be auto-assigned
-    q1 = SurveyQuestion.objects.create(
-        survey=survey,
-        text="What is your name?",
-        type=SurveyQuestion.Types.TEXT,
-        required=True,
-        order=0,
-    )
-    q2 = SurveyQuestion.objects.create(
-        survey=survey,
-        text="What is your age?",
-        type=SurveyQuestion.Types.TEXT,
-        required=True,
-        order=1,
-    )
-    q3 = SurveyQuestion.objects.create(
-        survey=survey,
-        text="Choose one:",
-        type=SurveyQuestion.Types.MULTIPLE_CHOICE_SINGLE,
-        required=False,
-        order=2,
-    )
-
-    # Store question IDs for easy test access
-    survey._test_q1_id = q1.id
-    survey._test_q2_id = q2.id
-    survey._test_q3_id = q3.id
-
-    return survey
-
-
-@pytest.fixture
-def public_survey(survey_owner, test_organization):
-    """Create a public survey for anonymous testing."""
-    survey = Survey.objects.create(
-        owner=survey_owner,
-        name="Public Survey",
-        slug="public-survey",
-        status=Survey.Status.PUBLISHED,
-        visibility=Survey.Visibility.PUBLIC,
-        organization=test_organization,
-    )
-
-    q1 = SurveyQuestion.objects.create(
-        survey=survey,
-        text="Question 1",
-        type=SurveyQuestion.Types.TEXT,
-        required=True,
-        order=0,
-    )
-    q2 = SurveyQuestion.objects.create(
-        survey=survey,
-        text="Question 2",
-        type=SurveyQuestion.Types.TEXT,
-        required=False,
-        order=1,
-    )
-
-    survey._test_q1_id = q1.id
-    survey._test_q2_id = q2.id
-
-    return survey
-
-
-@pytest.fixture
-def token_survey(survey_owner, test_organization):
-    """Create a token-based survey."""
-    survey = Survey.objects.create(
-        owner=survey_owner,
-        name="Token Survey",
-        slug="token-survey",
-        status=Survey.Status.PUBLISHED,
-        visibility=Survey.Visibility.TOKEN,
-        organization=test_organization,
-    )
-
-    q1 = SurveyQuestion.objects.create(
-        survey=survey,
-        text="Token question",
-        type=SurveyQuestion.Types.TEXT,
-        required=True,
-        order=0,
-    )
-
-    survey._test_q1_id = q1.id
-
-    return survey
+# Tests log in with force_login(), so the users get unusable passwords
+@pytest.fixture(scope="module")
+def survey_owner(module_db, django_db_blocker):
+    """Create a survey owner user, once per module."""
+    with django_db_blocker.unblock():
+        return User.objects.create_user(username="owner@example.com")
+
+
+@pytest.fixture(scope="module")
+def participant(module_db, django_db_blocker):
+    """Create a participant user, once per module."""
+    with django_db_blocker.unblock():
+        return User.objects.create_user(username="participant@example.com")
+
+
+@pytest.fixture(scope="module")
+def another_participant(module_db, django_db_blocker):
+    """Create another participant user, once per module."""
+    with django_db_blocker.unblock():
+        return User.objects.create_user(username="another@example.com")
+
+
+@pytest.fixture(scope="module")
+def test_organization(survey_owner, django_db_blocker):
+    """Create a test organization, once per module."""
+    with django_db_blocker.unblock():
+        return Organization.objects.create(
+            name="Test Organization",
+            owner=survey_owner,
+        )
+
+
+@pytest.fixture(scope="module")
+def published_survey(survey_owner, test_organization, django_db_blocker):
+    """Create a published survey, once per module."""
+    with django_db_blocker.unblock():
+        return Survey.objects.create(
+            owner=survey_owner,
+            name="Test Survey",
+            slug="test-survey",
+            status=Survey.Status.PUBLISHED,
+            visibility=Survey.Visibility.AUTHENTICATED,
+            allow_any_authenticated=True,  # Allow any authenticated user for testing
+            organization=test_organization,
+        )
+
+
+@pytest.fixture(scope="module")
+def published_questions(published_survey, django_db_blocker):
+    """The published survey's three questions, created once per module."""
+    with django_db_blocker.unblock():
+        return SurveyQuestion.objects.bulk_create(
+            [
+                SurveyQuestion(
+                    survey=published_survey,
+                    text="What is your name?",
+                    type=SurveyQuestion.Types.TEXT,
+                    required=True,
+                    order=0,
+                ),
+                SurveyQuestion(
+                    survey=published_survey,
+                    text="What is your age?",
+                    type=SurveyQuestion.Types.TEXT,
+                    required=True,
+                    order=1,
+                ),
+                SurveyQuestion(
+                    survey=published_survey,
+                    text="Choose one:",
+                    type=SurveyQuestion.Types.MULTIPLE_CHOICE_SINGLE,
+                    required=False,
+                    order=2,
+                ),
+            ]
+        )
+
+
+@pytest.fixture(scope="module")
+def public_survey(survey_owner, test_organization, django_db_blocker):
+    """Create a public survey for anonymous testing, once per module."""
+    with django_db_blocker.unblock():
+        return Survey.objects.create(
+            owner=survey_owner,
+            name="Public Survey",
+            slug="public-survey",
+            status=Survey.Status.PUBLISHED,
+            visibility=Survey.Visibility.PUBLIC,
+            organization=test_organization,
+        )
+
+
+@pytest.fixture(scope="module")
+def public_questions(public_survey, django_db_blocker):
+    """The public survey's two questions, created once per module."""
+    with django_db_blocker.unblock():
+        return SurveyQuestion.objects.bulk_create(
+            [
+                SurveyQuestion(
+                    survey=public_survey,
+                    text="Question 1",
+                    type=SurveyQuestion.Types.TEXT,
+                    required=True,
+                    order=0,
+                ),
+                SurveyQuestion(
+                    survey=public_survey,
+                    text="Question 2",
+                    type=SurveyQuestion.Types.TEXT,
+                    required=False,
+                    order=1,
+                ),
+            ]
+        )
+
+
+@pytest.fixture(scope="module")
+def token_survey(survey_owner, test_organization, django_db_blocker):
+    """Create a token-based survey, once per module."""
+    with django_db_blocker.unblock():
+        return Survey.objects.create(
+            owner=survey_owner,
+            name="Token Survey",
+            slug="token-survey",
+            status=Survey.Status.PUBLISHED,
+            visibility=Survey.Visibility.TOKEN,
+            organization=test_organization,
+        )
+
+
+@pytest.fixture(scope="module")
+def token_question(token_survey, django_db_blocker):
+    """The token survey's single question, created once per module."""
+    with django_db_blocker.unblock():
+        return SurveyQuestion.objects.create(
+            survey=token_survey,
+            text="Token question",
+            type=SurveyQuestion.Types.TEXT,
+            required=True,
+            order=0,
+        )
 
 
 # ============================================================================
@@ -184,21 +221,18 @@ class TestAuthenticatedProgress:
     """Tests for progress tracking with authenticated users."""
 
     def test_progress_saved_for_authenticated_user(
-        self, client, published_survey, participant
+        self, client, published_survey, published_questions, participant
     ):
         """Progress should be saved when authenticated user submits draft."""
-        client.login(username="participant@example.com", password=TEST_PASSWORD)
-
-        url = reverse("surveys:take", kwargs={"slug": published_survey.slug})
-        questions = published_survey.questions.all()
+        client.force_login(participant)
 
         # Save draft
         response = client.post(
-            url,
+            PUBLISHED_SURVEY_URL,
             {
                 "action": "save_draft",
-                f"q_{questions[0].id}": "John Doe",
-                f"q_{questions[1].id}": "30",
+                f"q_{published_questions[0].id}": "John Doe",
+                f"q_{published_questions[1].id}": "30",
             },
             HTTP_X_REQUESTED_WITH="XMLHttpRequest",
         )
@@ -206,39 +240,35 @@ class TestAuthenticatedProgress:
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
-        assert "progress" in data
-
-        # Verify progress record created
-        progress = SurveyProgress.objects.get(survey=published_survey, user=participant)
-        assert progress.answered_count == 2
-        assert progress.total_questions == 3
-        # Answers stored with question ID as key (not q_<id>)
-        assert progress.partial_answers[str(questions[0].id)] == "John Doe"
-        assert progress.partial_answers[str(questions[1].id)] == "30"
+        # The counts come from the saved record; the stored answers are
+        # checked by the update and separate-users tests below
+        assert data["progress"] == {"percentage": 66, "answered": 2, "total": 3}
 
-    def test_progress_restored_on_return(self, client, published_survey, participant):
+    def test_progress_restored_on_return(
+        self, client, published_survey, published_questions, participant
+    ):
         """Previously saved answers should be restored when user returns."""
-        questions = published_survey.questions.all()
 
         # Create existing progress - keys are question IDs not q_<id>
         SurveyProgress.objects.create(
             survey=published_survey,
             user=participant,
             partial_answers={
-                str(questions[0].id): "Jane Smith",
-                str(questions[1].id): "25",
+                str(published_questions[0].id): "Jane Smith",
+                str(published_questions[1].id): "25",
             },
-            current_question_id=questions[1].id,
+            current_question_id=published_questions[1].id,
             total_questions=3,
             answered_count=2,
             expires_at=timezone.now() + timedelta(days=30),
         )
 
-        client.login(username="participant@example.com", password=TEST_PASSWORD)
-        url = reverse("surveys:take", kwargs={"slug": published_survey.slug})
-        response = client.get(url)
+        client.force_login(participant)
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(PUBLISHED_SURVEY_URL)
 
         assert response.status_code == 200
+        assert len(queries) <= TAKE_PAGE_MAX_QUERIES
         context = response.context
 
         # Check progress context - uses show_progress not has_progress
@@ -249,35 +279,33 @@ class TestAuthenticatedProgress:
 
         # Check answers are in context - stored as question IDs
         saved_answers = context["saved_answers"]
-        assert saved_answers[str(questions[0].id)] == "Jane Smith"
-        assert saved_answers[str(questions[1].id)] == "25"
+        assert saved_answers[str(published_questions[0].id)] == "Jane Smith"
+        assert saved_answers[str(published_questions[1].id)] == "25"
 
     def test_progress_deleted_on_submission(
-        self, client, published_survey, participant
+        self, client, published_survey, published_questions, participant
     ):
         """Progress should be deleted when survey is successfully submitted."""
-        questions = published_survey.questions.all()
 
         # Create existing progress
         SurveyProgress.objects.create(
             survey=published_survey,
             user=participant,
-            partial_answers={str(questions[0].id): "Test"},
-            current_question_id=questions[0].id,
+            partial_answers={str(published_questions[0].id): "Test"},
+            current_question_id=published_questions[0].id,
             total_questions=3,
             answered_count=1,
             expires_at=timezone.now() + timedelta(days=30),
         )
 
-        client.login(username="participant@example.com", password=TEST_PASSWORD)
-        url = reverse("surveys:take", kwargs={"slug": published_survey.slug})
+        client.force_login(participant)
 
         # Submit complete survey
         response = client.post(
-            url,
+            PUBLISHED_SURVEY_URL,
             {
-                f"q_{questions[0].id}": "Complete Name",
-                f"q_{questions[1].id}": "35",
+                f"q_{published_questions[0].id}": "Complete Name",
+                f"q_{published_questions[1].id}": "35",
             },
         )
 
@@ -291,32 +319,30 @@ class TestAuthenticatedProgress:
         ).exists()
 
     def test_one_progress_per_user_per_survey(
-        self, client, published_survey, participant
+        self, client, published_survey, published_questions, participant
     ):
         """Should only allow one progress record per user per survey."""
-        questions = published_survey.questions.all()
 
         # Create initial progress
         progress1 = SurveyProgress.objects.create(
             survey=published_survey,
             user=participant,
-            partial_answers={str(questions[0].id): "First"},
-            current_question_id=questions[0].id,
+            partial_answers={str(published_questions[0].id): "First"},
+            current_question_id=published_questions[0].id,
             total_questions=3,
             answered_count=1,
             expires_at=timezone.now() + timedelta(days=30),
         )
 
-        client.login(username="participant@example.com", password=TEST_PASSWORD)
-        url = reverse("surveys:take", kwargs={"slug": published_survey.slug})
+        client.force_login(participant)
 
         # Save draft again - should update, not create new
         response = client.post(
-            url,
+            PUBLISHED_SURVEY_URL,
             {
                 "action": "save_draft",
-                f"q_{questions[0].id}": "Updated",
-                f"q_{questions[1].id}": "40",
+                f"q_{published_questions[0].id}": "Updated",
+                f"q_{published_questions[1].id}": "40",
             },
             HTTP_X_REQUESTED_WITH="XMLHttpRequest",
         )
@@ -324,32 +350,34 @@ class TestAuthenticatedProgress:
         assert response.status_code == 200
 
         # Should still be only one progress record
-        assert (
-            SurveyProgress.objects.filter(
-                survey=published_survey, user=participant
-            ).count()
-            == 1
+        progresses = list(
+            SurveyProgress.objects.filter(survey=published_survey, user=participant)
         )
+        assert len(progresses) == 1
 
         # Should be updated
-        progress1.refresh_from_db()
-        assert progress1.partial_answers[str(questions[0].id)] == "Updated"
-        assert progress1.answered_count == 2
+        (progress,) = progresses
+        assert progress.pk == progress1.pk
+        assert progress.partial_answers[str(published_questions[0].id)] == "Updated"
+        assert progress.answered_count == 2
 
     def test_different_users_have_separate_progress(
-        self, client, published_survey, participant, another_participant
+        self,
+        client,
+        published_survey,
+        published_questions,
+        participant,
+        another_participant,
     ):
         """Different users should have independent progress records."""
-        questions = published_survey.questions.all()
 
         # User 1 saves progress
-        client.login(username="participant@example.com", password=TEST_PASSWORD)
-        url = reverse("surveys:take", kwargs={"slug": published_survey.slug})
+        client.force_login(participant)
         client.post(
-            url,
+            PUBLISHED_SURVEY_URL,
             {
                 "action": "save_draft",
-                f"q_{questions[0].id}": "User One",
+                f"q_{published_questions[0].id}": "User One",
             },
             HTTP_X_REQUESTED_WITH="XMLHttpRequest",
         )
@@ -357,28 +385,60 @@ class TestAuthenticatedProgress:
         client.logout()
 
         # User 2 saves different progress
-        client.login(username="another@example.com", password=TEST_PASSWORD)
+        client.force_login(another_participant)
         client.post(
-            url,
+            PUBLISHED_SURVEY_URL,
             {
                 "action": "save_draft",
-                f"q_{questions[0].id}": "User Two",
+                f"q_{published_questions[0].id}": "User Two",
             },
             HTTP_X_REQUESTED_WITH="XMLHttpRequest",
         )
 
         # Should have 2 separate progress records
-        assert SurveyProgress.objects.filter(survey=published_survey).count() == 2
+        progress_by_user = {
+            progress.user_id: progress
+            for progress in SurveyProgress.objects.filter(survey=published_survey)
+        }
+        assert len(progress_by_user) == 2
 
-        progress1 = SurveyProgress.objects.get(
-            survey=published_survey, user=participant
-        )
-        progress2 = SurveyProgress.objects.get(
-            survey=published_survey, user=another_participant
-        )
+        progress1 = progress_by_user[participant.pk]
+        progress2 = progress_by_user[another_participant.pk]
 
-        assert progress1.partial_answers[str(questions[0].id)] == "User One"
-        assert progress2.partial_answers[str(questions[0].id)] == "User Two"
+        assert progress1.partial_answers[str(published_questions[0].id)] == "User One"
+        assert progress2.partial_answers[str(published_questions[0].id)] == "User Two"
+
+    def test_draft_save_query_count_does_not_grow_with_questions(
+        self, client, published_survey, published_questions, participant
+    ):
+        """Saving a draft reads the questions in one query, not one per question."""
+        draft = {"action": "save_draft", f"q_{published_questions[0].id}": "Name"}
+        client.force_login(participant)
+
+        def save_draft():
+            with CaptureQueriesContext(connection) as queries:
+                response = client.post(
+                    PUBLISHED_SURVEY_URL, draft, HTTP_X_REQUESTED_WITH="XMLHttpRequest"
+                )
+            assert response.status_code == 200
+            return len(queries)
+
+        # The first save creates the progress record; compare later saves only
+        save_draft()
+        three_questions = save_draft()
+        SurveyQuestion.objects.bulk_create(
+            [
+                SurveyQuestion(
+                    survey=published_survey,
+                    text=f"Extra question {i}",
+                    type=SurveyQuestion.Types.TEXT,
+                    order=3 + i,
+                )
+                for i in range(3)
+            ]
+        )
+
+        assert save_draft() == three_questions
 
 
 # ============================================================================
@@ -390,17 +450,17 @@ class TestAuthenticatedProgress:
 class TestAnonymousProgress:
     """Tests for progress tracking with anonymous users using sessions."""
 
-    def test_progress_saved_for_anonymous_user(self, client, public_survey):
+    def test_progress_saved_for_anonymous_user(
+        self, client, public_survey, public_questions
+    ):
         """Progress should be saved for anonymous users using session key."""
-        url = reverse("surveys:take", kwargs={"slug": public_survey.slug})
-        questions = public_survey.questions.all()
 
         # Anonymous user saves draft
         response = client.post(
-            url,
+            PUBLIC_SURVEY_URL,
             {
                 "action": "save_draft",
-                f"q_{questions[0].id}": "Anonymous Answer",
+                f"q_{public_questions[0].id}": "Anonymous Answer",
             },
             HTTP_X_REQUESTED_WITH="XMLHttpRequest",
         )
@@ -417,17 +477,17 @@ class TestAnonymousProgress:
         assert progress.user is None
         assert progress.answered_count == 1
 
-    def test_anonymous_progress_restored_same_session(self, client, public_survey):
+    def test_anonymous_progress_restored_same_session(
+        self, client, public_survey, public_questions
+    ):
         """Anonymous user should see their progress in the same session."""
-        questions = public_survey.questions.all()
 
         # First request to establish session and save some progress
-        url = reverse("surveys:take", kwargs={"slug": public_survey.slug})
         client.post(
-            url,
+            PUBLIC_SURVEY_URL,
             {
                 "action": "save_draft",
-                f"q_{questions[0].id}": "Saved Answer",
+                f"q_{public_questions[0].id}": "Saved Answer",
             },
             HTTP_X_REQUESTED_WITH="XMLHttpRequest",
         )
@@ -437,27 +497,27 @@ class TestAnonymousProgress:
         progress = SurveyProgress.objects.get(
             survey=public_survey, session_key=session_key
         )
-        assert progress.partial_answers[str(questions[0].id)] == "Saved Answer"
+        assert progress.partial_answers[str(public_questions[0].id)] == "Saved Answer"
 
         # Get survey again in same session
-        response = client.get(url)
+        response = client.get(PUBLIC_SURVEY_URL)
 
         assert response.status_code == 200
         context = response.context
         assert context["show_progress"] is True
-        assert context["saved_answers"][str(questions[0].id)] == "Saved Answer"
+        assert context["saved_answers"][str(public_questions[0].id)] == "Saved Answer"
 
-    def test_different_sessions_have_separate_progress(self, client, public_survey):
+    def test_different_sessions_have_separate_progress(
+        self, client, public_survey, public_questions
+    ):
         """Different anonymous sessions should have independent progress."""
-        questions = list(public_survey.questions.all())
-        url = reverse("surveys:take", kwargs={"slug": public_survey.slug})
 
         # Session 1
         response1 = client.post(
-            url,
+            PUBLIC_SURVEY_URL,
             {
                 "action": "save_draft",
-                f"q_{questions[0].id}": "Session 1",
+                f"q_{public_questions[0].id}": "Session 1",
             },
             HTTP_X_REQUESTED_WITH="XMLHttpRequest",
         )
@@ -468,17 +528,17 @@ class TestAnonymousProgress:
         progress1 = SurveyProgress.objects.get(
             survey=public_survey, session_key=session1_key
         )
-        assert str(questions[0].id) in progress1.partial_answers
+        assert str(public_questions[0].id) in progress1.partial_answers
 
         # Clear session to simulate new browser
         client.session.flush()
 
         # Session 2
         response2 = client.post(
-            url,
+            PUBLIC_SURVEY_URL,
             {
                 "action": "save_draft",
-                f"q_{questions[0].id}": "Session 2",
+                f"q_{public_questions[0].id}": "Session 2",
             },
             HTTP_X_REQUESTED_WITH="XMLHttpRequest",
         )
@@ -486,18 +546,20 @@ class TestAnonymousProgress:
         session2_key = client.session.session_key
 
         # Should have 2 separate progress records
-        assert SurveyProgress.objects.filter(survey=public_survey).count() == 2
+        progress_by_session = {
+            progress.session_key: progress
+            for progress in SurveyProgress.objects.filter(survey=public_survey)
+        }
+        assert len(progress_by_session) == 2
 
-        progress1.refresh_from_db()
-        progress2 = SurveyProgress.objects.get(
-            survey=public_survey, session_key=session2_key
-        )
+        progress1 = progress_by_session[session1_key]
+        progress2 = progress_by_session[session2_key]
 
         # Verify both have correct data
-        assert str(questions[0].id) in progress1.partial_answers
-        assert str(questions[0].id) in progress2.partial_answers
-        assert progress1.partial_answers[str(questions[0].id)] == "Session 1"
-        assert progress2.partial_answers[str(questions[0].id)] == "Session 2"
+        assert str(public_questions[0].id) in progress1.partial_answers
+        assert str(public_questions[0].id) in progress2.partial_answers
+        assert progress1.partial_answers[str(public_questions[0].id)] == "Session 1"
+        assert progress2.partial_answers[str(public_questions[0].id)] == "Session 2"
 
 
 # ============================================================================
@@ -509,7 +571,9 @@ class TestAnonymousProgress:
 class TestTokenProgress:
     """Tests for progress tracking with token-based surveys."""
 
-    def test_progress_saved_with_token(self, client, token_survey, survey_owner):
+    def test_progress_saved_with_token(
+        self, client, token_survey, token_question, survey_owner
+    ):
         """Progress should be saved for token-based survey access."""
         token = SurveyAccessToken.objects.create(
             survey=token_survey,
@@ -521,14 +585,13 @@ class TestTokenProgress:
             "surveys:take_token",
             kwargs={"slug": token_survey.slug, "token": token.token},
         )
-        questions = token_survey.questions.all()
 
         # Save draft
         response = client.post(
             url,
             {
                 "action": "save_draft",
-                f"q_{questions[0].id}": "Token Answer",
+                f"q_{token_question.id}": "Token Answer",
             },
             HTTP_X_REQUESTED_WITH="XMLHttpRequest",
         )
@@ -544,7 +607,9 @@ class TestTokenProgress:
         )
         assert progress.answered_count == 1
 
-    def test_token_cannot_be_used_twice(self, client, token_survey, survey_owner):
+    def test_token_cannot_be_used_twice(
+        self, client, token_survey, token_question, survey_owner
+    ):
         """Used tokens should not allow access to survey."""
         token = SurveyAccessToken.objects.create(
             survey=token_survey,
@@ -556,12 +621,11 @@ class TestTokenProgress:
             "surveys:take_token",
             kwargs={"slug": token_survey.slug, "token": token.token},
         )
-        questions = token_survey.questions.all()
 
         # First submission - complete survey
         response = client.post(
             url,
-            {f"q_{questions[0].id}": "Complete Answer"},
+            {f"q_{token_question.id}": "Complete Answer"},
         )
 
         # Should redirect to thank you
@@ -585,7 +649,7 @@ class TestTokenProgress:
             url,
             {
                 "action": "save_draft",
-                f"q_{questions[0].id}": "Should not save",
+                f"q_{token_question.id}": "Should not save",
             },
             HTTP_X_REQUESTED_WITH="XMLHttpRequest",
         )
@@ -628,26 +692,29 @@ class TestProgressPermissions:
     """Tests for ensuring users can only access their own progress."""
 
     def test_authenticated_user_cannot_see_other_user_progress(
-        self, client, published_survey, participant, another_participant
+        self,
+        client,
+        published_survey,
+        published_questions,
+        participant,
+        another_participant,
     ):
         """Users should only see their own progress, not other users'."""
-        questions = published_survey.questions.all()
 
         # Create progress for another user
         SurveyProgress.objects.create(
             survey=published_survey,
             user=another_participant,
-            partial_answers={str(questions[0].id): "Other User Answer"},
-            current_question_id=questions[0].id,
+            partial_answers={str(published_questions[0].id): "Other User Answer"},
+            current_question_id=published_questions[0].id,
             total_questions=3,
             answered_count=1,
             expires_at=timezone.now() + timedelta(days=30),
         )
 
         # Login as different user
-        client.login(username="participant@example.com", password=TEST_PASSWORD)
-        url = reverse("surveys:take", kwargs={"slug": published_survey.slug})
-        response = client.get(url)
+        client.force_login(participant)
+        response = client.get(PUBLISHED_SURVEY_URL)
 
         assert response.status_code == 200
         context = response.context
@@ -661,10 +728,9 @@ class TestProgressPermissions:
         self, client, published_survey, participant
     ):
         """Anonymous users should not access authenticated surveys."""
-        url = reverse("surveys:take", kwargs={"slug": published_survey.slug})
 
         # Try to access without login
-        response = client.get(url)
+        response = client.get(PUBLISHED_SURVEY_URL)
 
         # Should redirect to login
         assert response.status_code == 302
@@ -702,26 +768,29 @@ class TestProgressCleanup:
 
         user = User.objects.create_user(username="cleanup_user", password="x")
 
-        # Create expired progress (>30 days old)
-        old_progress = SurveyProgress.objects.create(
-            survey=survey1,
-            user=user,
-            partial_answers={"1": "old"},
-            current_question_id=1,
-            total_questions=3,
-            answered_count=1,
-            expires_at=timezone.now() - timedelta(days=31),
-        )
-
-        # Create recent progress
-        recent_progress = SurveyProgress.objects.create(
-            survey=survey2,
-            user=user,
-            partial_answers={"2": "recent"},
-            current_question_id=2,
-            total_questions=3,
-            answered_count=1,
-            expires_at=timezone.now() + timedelta(days=29),
+        old_progress, recent_progress = SurveyProgress.objects.bulk_create(
+            [
+                # Expired progress (>30 days old)
+                SurveyProgress(
+                    survey=survey1,
+                    user=user,
+                    partial_answers={"1": "old"},
+                    current_question_id=1,
+                    total_questions=3,
+                    answered_count=1,
+                    expires_at=timezone.now() - timedelta(days=31),
+                ),
+                # Recent progress
+                SurveyProgress(
+                    survey=survey2,
+                    user=user,
+                    partial_answers={"2": "recent"},
+                    current_question_id=2,
+                    total_questions=3,
+                    answered_count=1,
+                    expires_at=timezone.now() + timedelta(days=29),
+                ),
+            ]
         )
 
         # Run cleanup
@@ -764,30 +833,33 @@ class TestProgressCleanup:
         assert SurveyProgress.objects.filter(id=old_progress.id).exists()
 
     def test_progress_expires_after_30_days(
-        self, client, published_survey, participant
+        self, client, published_survey, published_questions, participant
     ):
         """New progress should have 30-day expiry."""
-        client.login(username="participant@example.com", password=TEST_PASSWORD)
-
-        url = reverse("surveys:take", kwargs={"slug": published_survey.slug})
-        questions = published_survey.questions.all()
+        client.force_login(participant)
 
         # Save draft
+        before = timezone.now()
         client.post(
-            url,
+            PUBLISHED_SURVEY_URL,
             {
                 "action": "save_draft",
-                f"q_{questions[0].id}": "Test",
+                f"q_{published_questions[0].id}": "Test",
             },
             HTTP_X_REQUESTED_WITH="XMLHttpRequest",
         )
+        after = timezone.now()
 
         # Check expiry
         progress = SurveyProgress.objects.get(survey=published_survey, user=participant)
 
-        # Should expire in approximately 30 days
-        time_until_expiry = progress.expires_at - timezone.now()
-        assert 29 <= time_until_expiry.days <= 30
+        # Should expire 30 days after the save, whenever within the request
+        # that happened
+        assert (
+            before + timedelta(days=30)
+            <= progress.expires_at
+            <= after + timedelta(days=30)
+        )
 
 
 # ============================================================================
@@ -795,75 +867,47 @@ class TestProgressCleanup:
 # ============================================================================
 
 
-@pytest.mark.django_db
-class TestProgressEdgeCases:
-    """Tests for edge cases and error handling."""
+class TestProgressPercentage:
+    """
+    calculate_progress_percentage() only reads two counters, so these tests
+    use unsaved SurveyProgress instances and need no database.
+    """
 
-    def test_progress_percentage_calculation(self, survey_owner, test_organization):
+    def test_progress_percentage_calculation(self):
         """Progress percentage should be calculated correctly."""
-        survey = Survey.objects.create(
-            owner=survey_owner,
-            name="Percentage Test Survey",
-            slug="percentage-test",
-            status=Survey.Status.PUBLISHED,
-            visibility=Survey.Visibility.PUBLIC,
-            organization=test_organization,
-        )
-        user = User.objects.create_user(username="percentage_user", password="x")
-
-        progress = SurveyProgress.objects.create(
-            survey=survey,
-            user=user,
-            partial_answers={},
-            current_question_id=1,
-            total_questions=3,
-            answered_count=2,
-            expires_at=timezone.now() + timedelta(days=30),
-        )
+        progress = SurveyProgress(total_questions=3, answered_count=2)
 
         assert progress.calculate_progress_percentage() == 66
 
-    def test_progress_percentage_zero_questions(self, survey_owner, test_organization):
+    def test_progress_percentage_zero_questions(self):
         """Should handle zero questions gracefully."""
-        survey = Survey.objects.create(
-            owner=survey_owner,
-            name="Zero Questions Survey",
-            slug="zero-questions-test",
-            status=Survey.Status.PUBLISHED,
-            visibility=Survey.Visibility.PUBLIC,
-            organization=test_organization,
-        )
-        user = User.objects.create_user(username="zero_user", password="x")
-
-        progress = SurveyProgress.objects.create(
-            survey=survey,
-            user=user,
-            partial_answers={},
-            current_question_id=1,
-            total_questions=0,
-            answered_count=0,
-            expires_at=timezone.now() + timedelta(days=30),
-        )
+        progress = SurveyProgress(total_questions=0, answered_count=0)
 
         assert progress.calculate_progress_percentage() == 0
 
-    def test_empty_draft_save(self, client, published_survey, participant):
-        """Should handle saving empty draft without errors."""
-        client.login(username="participant@example.com", password=TEST_PASSWORD)
 
-        url = reverse("surveys:take", kwargs={"slug": published_survey.slug})
+@pytest.mark.django_db
+class TestProgressEdgeCases:
+    """Tests for edge cases and error handling."""
 
-        # Save empty draft
-        response = client.post(
-            url,
+    @pytest.mark.usefixtures("published_questions")
+    def test_empty_draft_save(self, published_survey, participant):
+        """Should handle saving empty draft without errors."""
+        # Call the view directly; the client-based tests above cover the
+        # middleware around it
+        request = RequestFactory().post(
+            PUBLISHED_SURVEY_URL,
             {"action": "save_draft"},
             HTTP_X_REQUESTED_WITH="XMLHttpRequest",
         )
+        request.user = participant
+
+        # Save empty draft
+        response = views.survey_take(request, slug=published_survey.slug)
 
         assert response.status_code == 200
-        data = response.json()
+        data = json.loads(response.content)
         assert data["success"] is True
 
         # Should create progress with zero answers
-        progress = SurveyProgress.objects.get(survey=published_survey, user=participant)
-        assert progress.answered_count == 0
+        assert data["progress"]["answered"] == 0
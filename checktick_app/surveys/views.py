@@ -10679,7 +10679,7 @@ def get_admin_context(request: HttpRequest) -> dict:
         try:
             org = Organization.objects.get(id=org_id)
             # Check if user is org owner or admin
-            is_owner = org.owner == request.user
+            is_owner = org.owner_id == request.user.id
             is_admin = OrganizationMembership.objects.filter(
                 organization=org,
                 user=request.user,
@@ -10710,7 +10710,7 @@ def get_admin_context(request: HttpRequest) -> dict:
         try:
             team = Team.objects.get(id=team_id)
             # Check if user is team owner or admin
-            is_owner = team.owner == request.user
+            is_owner = team.owner_id == request.user.id
             is_admin = TeamMembership.objects.filter(
                 team=team,
                 user=request.user,
@@ -10719,7 +10719,7 @@ def get_admin_context(request: HttpRequest) -> dict:
 
             if is_owner or is_admin:
                 # Determine if this is a standalone team or org-hosted
-                if team.organization:
+                if team.organization_id:
                     tier_display = "Team Admin"
                     tier_badge_class = "badge-accent"
                 else:
@@ -10786,25 +10786,26 @@ def admin_recovery_dashboard(request: HttpRequest) -> HttpResponse:
     # Get scoped requests
     requests_qs = get_scoped_recovery_requests(context)
 
-    # Calculate stats
-    stats = {
-        "total": requests_qs.count(),
-        "pending": requests_qs.filter(
-            status__in=[
-                RecoveryRequest.Status.PENDING_VERIFICATION,
-                RecoveryRequest.Status.VERIFICATION_IN_PROGRESS,
-                RecoveryRequest.Status.AWAITING_PRIMARY,
-                RecoveryRequest.Status.AWAITING_SECONDARY,
-            ]
-        ).count(),
-        "in_delay": requests_qs.filter(
-            status=RecoveryRequest.Status.IN_TIME_DELAY
-        ).count(),
-        "completed": requests_qs.filter(
-            status=RecoveryRequest.Status.COMPLETED
-        ).count(),
-        "rejected": requests_qs.filter(status=RecoveryRequest.Status.REJECTED).count(),
-    }
+    # Calculate stats in a single query
+    stats = requests_qs.aggregate(
+        total=models.Count("id"),
+        pending=models.Count(
+            "id",
+            filter=Q(
+                status__in=[
+                    RecoveryRequest.Status.PENDING_VERIFICATION,
+                    RecoveryRequest.Status.VERIFICATION_IN_PROGRESS,
+                    RecoveryRequest.Status.AWAITING_PRIMARY,
+                    RecoveryRequest.Status.AWAITING_SECONDARY,
+                ]
+            ),
+        ),
+        in_delay=models.Count(
+            "id", filter=Q(status=RecoveryRequest.Status.IN_TIME_DELAY)
+        ),
+        completed=models.Count("id", filter=Q(status=RecoveryRequest.Status.COMPLETED)),
+        rejected=models.Count("id", filter=Q(status=RecoveryRequest.Status.REJECTED)),
+    )
 
     # Apply filter
     filter_param = request.GET.get("filter", "all")
@@ -0,0 +1,44 @@
+"""
+Shared fixtures for the top-level tests package.
+"""
+
+from django.db import transaction
+from django.test import override_settings
+import pytest
+
+
+@pytest.fixture(scope="module", autouse=True)
+def md5_password_hasher():
+    """
+    Hash test passwords with MD5 in each module here; the default is slow.
+
+    Nothing in this directory checks which hasher produced a password, and
+    logging in with an MD5-hashed password works the same way. The override
+    is module-scoped so it ends with each module and never reaches suites
+    elsewhere in the run, which keep the default hasher unless they opt in to
+    the surveys conftest's fast_password_hasher.
+    """
+    with override_settings(
+        PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"]
+    ):
+        yield
+
+
+@pytest.fixture(scope="class")
+def class_db(django_db_setup, django_db_blocker):
+    """
+    Keep a transaction open for the whole class (like TestCase.setUpTestData).
+
+    The same form as the surveys conftest's module_db, scoped to a class.
+    Class-scoped fixtures create their rows once inside it; each test still
+    runs in its own savepoint, and everything is rolled back after the class.
+    Because the transaction lives in its own fixture, pytest still tears it
+    down when a fixture building on it fails part-way through its setup.
+    """
+    with django_db_blocker.unblock():
+        atomic = transaction.atomic()
+        atomic.__enter__()
+    yield
+    with django_db_blocker.unblock():
+        transaction.set_rollback(True)
+        atomic.__exit__(None, None, None)
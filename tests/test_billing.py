@@ -14,18 +14,18 @@ Tests focus on:
 import csv
 from datetime import date, timedelta
 from io import StringIO
-import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 from django.conf import settings
 from django.contrib.admin.sites import AdminSite
 from django.contrib.auth import get_user_model
 from django.core.management import call_command
-from django.test import Client, RequestFactory, override_settings
+from django.test import RequestFactory, override_settings
 from django.urls import reverse
 from django.utils import timezone
 import pytest
 
+from checktick_app.core import views_billing
 from checktick_app.core.admin import PaymentAdmin
 from checktick_app.core.models import Payment, Promotion, UserProfile
 from checktick_app.core.services.promotion_resolver import (
@@ -36,14 +36,31 @@ from checktick_app.surveys.models import AuditLog, Organization, Survey
 
 User = get_user_model()
 
+WEBHOOK_URL = reverse("core:payment_webhook")
+EMPTY_WEBHOOK_BODY = b'{"events": []}'
 
+
+def _post_webhook(payload):
+    """
+    POST a webhook body straight to the view.
+
+    The endpoint is CSRF-exempt and uses neither the session nor the logged-in
+    user, so the tests skip the middleware stack.
+    """
+    request = RequestFactory().post(
+        WEBHOOK_URL, data=payload, content_type="application/json"
+    )
+    return views_billing.payment_webhook(request)
+
+
+# Nobody logs in as these users, so they get unusable passwords and nothing
+# is hashed
 @pytest.fixture
 def free_user(db):
     """Create a free tier user."""
     user = User.objects.create_user(
         username="freeuser@example.com",
         email="freeuser@example.com",
-        password="TestPass123!",
     )
     user.profile.account_tier = UserProfile.AccountTier.FREE
     user.profile.save()
@@ -56,7 +73,6 @@ def pro_user(db):
     user = User.objects.create_user(
         username="prouser@example.com",
         email="prouser@example.com",
-        password="TestPass123!",
     )
     user.profile.account_tier = UserProfile.AccountTier.PRO
     user.profile.payment_subscription_id = "sub_test123"
@@ -67,21 +83,33 @@ def pro_user(db):
     return user
 
 
-@pytest.fixture
-def org_user(db):
-    """Create a user with an organization."""
-    user = User.objects.create_user(
-        username="orguser@example.com",
-        email="orguser@example.com",
-        password="TestPass123!",
-    )
-    org = Organization.objects.create(name="Test Organization", owner=user)
-    user.profile.organization = org
-    user.profile.account_tier = UserProfile.AccountTier.PRO
-    user.profile.payment_subscription_id = "sub_org123"
-    user.profile.payment_customer_id = "ctm_org123"
-    user.profile.payment_provider = "paddle"
-    user.profile.save()
+@pytest.fixture(scope="class")
+def org_user(class_db, django_db_blocker):
+    """
+    Create a user with an organization, once per class.
+
+    The rows are created inside class_db's transaction and rolled back after
+    the class; each test's own savepoint undoes whatever it changes. The
+    organization is inserted with bulk_create(), which skips save() and its
+    signals.
+
+    This stays class-scoped: held for the rest of the module, the PRO org
+    user would be picked up by the promotion lifecycle command tests.
+    """
+    with django_db_blocker.unblock():
+        user = User.objects.create_user(
+            username="orguser@example.com",
+            email="orguser@example.com",
+        )
+        (org,) = Organization.objects.bulk_create(
+            [Organization(name="Test Organization", owner=user)]
+        )
+        user.profile.organization = org
+        user.profile.account_tier = UserProfile.AccountTier.PRO
+        user.profile.payment_subscription_id = "sub_org123"
+        user.profile.payment_customer_id = "ctm_org123"
+        user.profile.payment_provider = "paddle"
+        user.profile.save()
     return user
 
 
@@ -98,13 +126,13 @@ class TestFeatureUnlockingOnSuccessfulSubscription:
         # Mock webhook validation to return True
         mock_validate.return_value = True
 
-        # Set up payment mandate ID (GoCardless uses mandates)
-        free_user.profile.payment_mandate_id = "MD0001"
-        free_user.profile.payment_provider = "gocardless"
-        free_user.profile.account_tier = (
-            UserProfile.AccountTier.PRO
-        )  # Set by redirect flow completion
-        free_user.profile.save()
+        # Set up payment mandate ID (GoCardless uses mandates); the PRO tier
+        # is set by redirect flow completion
+        UserProfile.objects.filter(pk=free_user.profile.pk).update(
+            payment_mandate_id="MD0001",
+            payment_provider="gocardless",
+            account_tier=UserProfile.AccountTier.PRO,
+        )
 
         # GoCardless sends events in an array
         payload = {
@@ -121,22 +149,16 @@ class TestFeatureUnlockingOnSuccessfulSubscription:
             ]
         }
 
-        client = Client()
-        response = client.post(
-            reverse("core:payment_webhook"),
-            data=json.dumps(payload),
-            content_type="application/json",
-        )
+        response = _post_webhook(payload)
 
         assert response.status_code == 200
 
-        free_user.profile.refresh_from_db()
+        profile = UserProfile.objects.values(
+            "payment_subscription_id", "subscription_status"
+        ).get(pk=free_user.profile.pk)
         # Verify subscription ID was stored
-        assert free_user.profile.payment_subscription_id == "SB0001"
-        assert (
-            free_user.profile.subscription_status
-            == UserProfile.SubscriptionStatus.ACTIVE
-        )
+        assert profile["payment_subscription_id"] == "SB0001"
+        assert profile["subscription_status"] == UserProfile.SubscriptionStatus.ACTIVE
 
         # Verify welcome email was sent
         mock_email.assert_called_once()
@@ -148,10 +170,12 @@ class TestFeatureUnlockingOnSuccessfulSubscription:
         assert limits.max_surveys is None  # Unlimited
 
         # Create more than free tier limit (3)
-        for i in range(10):
-            Survey.objects.create(
-                name=f"Survey {i+1}", owner=pro_user, slug=f"pro-survey-{i+1}"
-            )
+        Survey.objects.bulk_create(
+            [
+                Survey(name=f"Survey {i+1}", owner=pro_user, slug=f"pro-survey-{i+1}")
+                for i in range(10)
+            ]
+        )
 
         assert Survey.objects.filter(owner=pro_user).count() == 10
 
@@ -177,23 +201,16 @@ class TestFeatureNotUnlockedOnUnsuccessfulSubscription:
             },
         }
 
-        client = Client()
-        _ = client.post(
-            reverse("core:payment_webhook"),
-            data=json.dumps(payload),
-            content_type="application/json",
-        )
+        _post_webhook(payload)
 
-        free_user.profile.refresh_from_db()
+        profile = UserProfile.objects.values("account_tier", "subscription_status").get(
+            pk=free_user.profile.pk
+        )
 
         # Tier should remain unchanged
-        assert free_user.profile.account_tier == initial_tier
+        assert profile["account_tier"] == initial_tier
         # Status may be set but tier shouldn't upgrade
-        if hasattr(free_user.profile, "subscription_status"):
-            assert (
-                free_user.profile.subscription_status
-                != UserProfile.SubscriptionStatus.ACTIVE
-            )
+        assert profile["subscription_status"] != UserProfile.SubscriptionStatus.ACTIVE
 
     @pytest.mark.django_db
     def test_free_user_cannot_create_more_than_3_surveys(self, free_user):
@@ -202,10 +219,12 @@ class TestFeatureNotUnlockedOnUnsuccessfulSubscription:
         assert limits.max_surveys == 3
 
         # Create 3 surveys (at the limit)
-        for i in range(3):
-            Survey.objects.create(
-                name=f"Survey {i+1}", owner=free_user, slug=f"free-survey-{i+1}"
-            )
+        Survey.objects.bulk_create(
+            [
+                Survey(name=f"Survey {i+1}", owner=free_user, slug=f"free-survey-{i+1}")
+                for i in range(3)
+            ]
+        )
 
         # The 4th survey creation should be prevented by application logic
         # (This is enforced in views/forms, not the model itself)
@@ -226,12 +245,17 @@ class TestDowngradeWorkflow:
         mock_validate.return_value = True
 
         # Update user to use GoCardless
-        pro_user.profile.payment_provider = "gocardless"
-        pro_user.profile.save()
+        UserProfile.objects.filter(pk=pro_user.profile.pk).update(
+            payment_provider="gocardless"
+        )
 
         # Create surveys within free tier limit
-        Survey.objects.create(name="Survey 1", owner=pro_user, slug="survey-1")
-        Survey.objects.create(name="Survey 2", owner=pro_user, slug="survey-2")
+        Survey.objects.bulk_create(
+            [
+                Survey(name="Survey 1", owner=pro_user, slug="survey-1"),
+                Survey(name="Survey 2", owner=pro_user, slug="survey-2"),
+            ]
+        )
 
         # GoCardless event format
         payload = {
@@ -247,23 +271,17 @@ class TestDowngradeWorkflow:
             ]
         }
 
-        client = Client()
-        response = client.post(
-            reverse("core:payment_webhook"),
-            data=json.dumps(payload),
-            content_type="application/json",
-        )
+        response = _post_webhook(payload)
 
         assert response.status_code == 200
 
-        pro_user.profile.refresh_from_db()
+        profile = UserProfile.objects.values(
+            "account_tier", "subscription_status", "payment_subscription_id"
+        ).get(pk=pro_user.profile.pk)
         # Verify downgrade to FREE
-        assert pro_user.profile.account_tier == UserProfile.AccountTier.FREE
-        assert (
-            pro_user.profile.subscription_status
-            == UserProfile.SubscriptionStatus.CANCELED
-        )
-        assert pro_user.profile.payment_subscription_id == ""
+        assert profile["account_tier"] == UserProfile.AccountTier.FREE
+        assert profile["subscription_status"] == UserProfile.SubscriptionStatus.CANCELED
+        assert profile["payment_subscription_id"] == ""
 
         # Verify cancellation email sent
         mock_email.assert_called_once()
@@ -279,14 +297,17 @@ class TestDowngradeWorkflow:
         mock_validate.return_value = True
 
         # Update user to use GoCardless
-        pro_user.profile.payment_provider = "gocardless"
-        pro_user.profile.save()
+        UserProfile.objects.filter(pk=pro_user.profile.pk).update(
+            payment_provider="gocardless"
+        )
 
         # Create 5 surveys
-        for i in range(5):
-            Survey.objects.create(
-                name=f"Survey {i+1}", owner=pro_user, slug=f"survey-{i+1}"
-            )
+        Survey.objects.bulk_create(
+            [
+                Survey(name=f"Survey {i+1}", owner=pro_user, slug=f"survey-{i+1}")
+                for i in range(5)
+            ]
+        )
 
         # GoCardless event format
         payload = {
@@ -302,12 +323,7 @@ class TestDowngradeWorkflow:
             ]
         }
 
-        client = Client()
-        response = client.post(
-            reverse("core:payment_webhook"),
-            data=json.dumps(payload),
-            content_type="application/json",
-        )
+        response = _post_webhook(payload)
 
         assert response.status_code == 200
 
@@ -317,15 +333,14 @@ class TestDowngradeWorkflow:
         ).count()
         assert closed_surveys == 2
 
-        # Email should include survey closure warning
-        call_args = mock_email.call_args[0]
-        assert call_args[4] == 2  # surveys_to_close parameter
+        # Email should include survey closure warning (surveys_to_close)
+        mock_email.assert_called_once_with(ANY, ANY, ANY, ANY, 2, ANY)
 
 
+@pytest.mark.django_db
 class TestOrganizationDowngradeProtection:
     """Test that organization users are protected from downgrades."""
 
-    @pytest.mark.django_db
     def test_organization_user_downgrade_preserves_org(self, org_user):
         """Test downgrade doesn't break organization structure."""
         initial_org = org_user.profile.organization
@@ -341,12 +356,7 @@ class TestOrganizationDowngradeProtection:
             },
         }
 
-        client = Client()
-        _ = client.post(
-            reverse("core:payment_webhook"),
-            data=json.dumps(payload),
-            content_type="application/json",
-        )
+        _post_webhook(payload)
 
         org_user.profile.refresh_from_db()
 
@@ -355,7 +365,6 @@ class TestOrganizationDowngradeProtection:
         assert org_user.profile.organization == initial_org
         assert Organization.objects.filter(id=initial_org.id).exists()
 
-    @pytest.mark.django_db
     def test_org_owner_manages_subscription_for_all_members(self, org_user):
         """Test that org owner's subscription affects all org members."""
         # This is a placeholder test - actual implementation depends on your business logic
@@ -651,12 +660,7 @@ class TestPaymentRecordCreation:
             ]
         }
 
-        client = Client()
-        response = client.post(
-            reverse("core:payment_webhook"),
-            data=json.dumps(payload),
-            content_type="application/json",
-        )
+        response = _post_webhook(payload)
 
         assert response.status_code == 200
 
@@ -699,12 +703,7 @@ class TestPaymentRecordCreation:
             ]
         }
 
-        client = Client()
-        response = client.post(
-            reverse("core:payment_webhook"),
-            data=json.dumps(payload),
-            content_type="application/json",
-        )
+        response = _post_webhook(payload)
 
         assert response.status_code == 200
         assert Payment.objects.count() == 1
@@ -768,12 +767,7 @@ class TestRefundWebhookLifecycle:
             ]
         }
 
-        client = Client()
-        response = client.post(
-            reverse("core:payment_webhook"),
-            data=json.dumps(payload),
-            content_type="application/json",
-        )
+        response = _post_webhook(payload)
 
         assert response.status_code == 200
         refund_payment.refresh_from_db()
@@ -818,17 +812,8 @@ class TestRefundWebhookLifecycle:
             ]
         }
 
-        client = Client()
-        first_response = client.post(
-            reverse("core:payment_webhook"),
-            data=json.dumps(payload),
-            content_type="application/json",
-        )
-        second_response = client.post(
-            reverse("core:payment_webhook"),
-            data=json.dumps(payload),
-            content_type="application/json",
-        )
+        first_response = _post_webhook(payload)
+        second_response = _post_webhook(payload)
 
         assert first_response.status_code == 200
         assert second_response.status_code == 200
@@ -878,12 +863,7 @@ class TestRefundWebhookLifecycle:
             ]
         }
 
-        client = Client()
-        response = client.post(
-            reverse("core:payment_webhook"),
-            data=json.dumps(payload),
-            content_type="application/json",
-        )
+        response = _post_webhook(payload)
 
         assert response.status_code == 200
         refund_payment.refresh_from_db()
@@ -903,12 +883,7 @@ class TestWebhookSignatureSecurity:
         """Webhook endpoint should reject requests when signature verification fails."""
         mock_verify.return_value = False
 
-        client = Client()
-        response = client.post(
-            reverse("core:payment_webhook"),
-            data=json.dumps({"events": []}),
-            content_type="application/json",
-        )
+        response = _post_webhook(EMPTY_WEBHOOK_BODY)
 
         assert response.status_code == 403
 
@@ -922,8 +897,8 @@ class TestWebhookSignatureSecurity:
 
         factory = RequestFactory()
         request = factory.post(
-            reverse("core:payment_webhook"),
-            data=json.dumps({"events": []}),
+            WEBHOOK_URL,
+            data=EMPTY_WEBHOOK_BODY,
             content_type="application/json",
             HTTP_WEBHOOK_SIGNATURE="dummy-signature",
         )
@@ -940,8 +915,8 @@ class TestWebhookSignatureSecurity:
 
         factory = RequestFactory()
         request = factory.post(
-            reverse("core:payment_webhook"),
-            data=json.dumps({"events": []}),
+            WEBHOOK_URL,
+            data=EMPTY_WEBHOOK_BODY,
             content_type="application/json",
             HTTP_WEBHOOK_SIGNATURE="dummy-signature",
         )
@@ -1000,17 +975,8 @@ class TestWebhookReplayProtection:
             ]
         }
 
-        client = Client()
-        first = client.post(
-            reverse("core:payment_webhook"),
-            data=json.dumps(payload),
-            content_type="application/json",
-        )
-        second = client.post(
-            reverse("core:payment_webhook"),
-            data=json.dumps(payload),
-            content_type="application/json",
-        )
+        first = _post_webhook(payload)
+        second = _post_webhook(payload)
 
         assert first.status_code == 200
         assert second.status_code == 200
@@ -1052,23 +1018,14 @@ class TestWebhookReplayProtection:
             ]
         }
 
-        client = Client()
-        first = client.post(
-            reverse("core:payment_webhook"),
-            data=json.dumps(payload),
-            content_type="application/json",
-        )
+        first = _post_webhook(payload)
         # Flip back to PAST_DUE to make a second replay observable.
         profile.refresh_from_db()
         assert profile.subscription_status == UserProfile.SubscriptionStatus.ACTIVE
         profile.subscription_status = UserProfile.SubscriptionStatus.PAST_DUE
         profile.save(update_fields=["subscription_status", "updated_at"])
 
-        second = client.post(
-            reverse("core:payment_webhook"),
-            data=json.dumps(payload),
-            content_type="application/json",
-        )
+        second = _post_webhook(payload)
 
         assert first.status_code == 200
         assert second.status_code == 200
@@ -1109,12 +1066,7 @@ class TestWebhookReplayProtection:
             ]
         }
 
-        client = Client()
-        response = client.post(
-            reverse("core:payment_webhook"),
-            data=json.dumps(payload),
-            content_type="application/json",
-        )
+        response = _post_webhook(payload)
 
         assert response.status_code == 200
         assert (
@@ -1414,10 +1366,16 @@ class TestSubscriptionExpiryCommand:
         from django.core.management import call_command
 
         # Create some surveys
-        for i in range(5):
-            Survey.objects.create(
-                name=f"Survey {i+1}", owner=expired_user, slug=f"expired-survey-{i+1}"
-            )
+        Survey.objects.bulk_create(
+            [
+                Survey(
+                    name=f"Survey {i+1}",
+                    owner=expired_user,
+                    slug=f"expired-survey-{i+1}",
+                )
+                for i in range(5)
+            ]
+        )
 
         call_command("process_expired_subscriptions")
 
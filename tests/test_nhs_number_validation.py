@@ -2,250 +2,227 @@
 Tests for NHS number and postcode validation endpoints.
 """
 
-from unittest.mock import MagicMock, patch
+from dataclasses import dataclass
+from unittest.mock import MagicMock
 
 from django.test import Client, override_settings
 import pytest
 
+NHS_NUMBER_URL = "/surveys/validate/nhs-number/"
+POSTCODE_URL = "/surveys/validate/postcode/"
 
-@pytest.fixture
+# The swap attributes both validated inputs render alongside their hx-post
+HTMX_ATTRIBUTES = (
+    b'hx-trigger="blur, keyup changed delay:500ms"',
+    b'hx-target="closest label"',
+    b'hx-swap="outerHTML"',
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _FakeResponse:
+    """The parts of a requests.Response the postcode view reads."""
+
+    status_code: int
+    _payload: dict
+
+    def json(self):
+        return self._payload
+
+
+_VALID = _FakeResponse(200, {"valid": True})
+_INVALID = _FakeResponse(200, {"valid": False})
+
+
+@pytest.fixture(scope="module")
 def client():
+    """
+    One test client for the whole module.
+
+    The client builds its middleware chain on the first request; sharing it
+    means that happens once rather than in every test. The endpoints are
+    anonymous, so there is no session to reset between tests.
+    """
     return Client()
 
 
 class TestNHSNumberValidation:
     """Tests for the NHS number HTMX validation endpoint."""
 
-    def test_valid_nhs_number_returns_success(self, client, db):
-        """Test that a valid NHS number returns success styling."""
-        # 4505577104 is a valid NHS number (passes checksum)
-        response = client.post(
-            "/surveys/validate/nhs-number/",
-            {"nhs_number": "4505577104"},
-        )
-        assert response.status_code == 200
-        content = response.content.decode()
-        assert "input-success" in content
-        assert "450 557 7104" in content  # Formatted as 3 3 4
-
-    def test_invalid_nhs_number_returns_error(self, client, db):
-        """Test that an invalid NHS number returns error styling."""
-        # 1234567890 is an invalid NHS number (fails checksum)
+    @pytest.mark.parametrize(
+        "nhs_number, expected, forbidden",
+        [
+            # 4505577104 is a valid NHS number (passes checksum); it is
+            # formatted as 3 3 4 and shown with a checkmark SVG
+            pytest.param(
+                "4505577104",
+                [b"input-success", b"450 557 7104", b"text-success", b"polyline"],
+                [b"input-error"],
+                id="valid",
+            ),
+            # 1234567890 fails the checksum; it is still formatted, and shown
+            # with an X icon SVG
+            pytest.param(
+                "1234567890",
+                [b"input-error", b"123 456 7890", b"text-error", b'<line x1="18"'],
+                [b"input-success"],
+                id="invalid",
+            ),
+            pytest.param(
+                "450 557 7104",
+                [b"input-success", b"450 557 7104"],
+                [],
+                id="spaces-normalised",
+            ),
+            pytest.param("12345", [b"input-error"], [], id="too-short"),
+        ],
+    )
+    def test_nhs_number_validation_styling(
+        self, client, db, nhs_number, expected, forbidden
+    ):
+        """Test the styling, formatting and icon returned for an NHS number."""
         response = client.post(
-            "/surveys/validate/nhs-number/",
-            {"nhs_number": "1234567890"},
+            NHS_NUMBER_URL,
+            {"nhs_number": nhs_number},
         )
         assert response.status_code == 200
-        content = response.content.decode()
-        assert "input-error" in content
-        assert "123 456 7890" in content  # Still formatted as 3 3 4
+        for marker in expected:
+            assert marker in response.content
+        for marker in forbidden:
+            assert marker not in response.content
 
     def test_empty_nhs_number_returns_empty_input(self, client, db):
         """Test that an empty NHS number returns a clean input."""
         response = client.post(
-            "/surveys/validate/nhs-number/",
+            NHS_NUMBER_URL,
             {"nhs_number": ""},
         )
         assert response.status_code == 200
-        content = response.content.decode()
-        assert "input-success" not in content
-        assert "input-error" not in content
-        assert 'placeholder="NHS number"' in content
-
-    def test_nhs_number_with_spaces_is_normalised(self, client, db):
-        """Test that NHS numbers with spaces are normalised."""
-        # 4505577104 with spaces should still validate
-        response = client.post(
-            "/surveys/validate/nhs-number/",
-            {"nhs_number": "450 557 7104"},
-        )
-        assert response.status_code == 200
-        content = response.content.decode()
-        assert "input-success" in content
-        assert "450 557 7104" in content
-
-    def test_short_nhs_number_returns_error(self, client, db):
-        """Test that a too-short NHS number returns error."""
-        response = client.post(
-            "/surveys/validate/nhs-number/",
-            {"nhs_number": "12345"},
-        )
-        assert response.status_code == 200
-        content = response.content.decode()
-        assert "input-error" in content
+        assert b"input-success" not in response.content
+        assert b"input-error" not in response.content
+        assert b'placeholder="NHS number"' in response.content
 
     def test_htmx_attributes_preserved_in_response(self, client, db):
         """Test that HTMX attributes are preserved in the response."""
         response = client.post(
-            "/surveys/validate/nhs-number/",
-            {"nhs_number": "4505577104"},
-        )
-        assert response.status_code == 200
-        content = response.content.decode()
-        assert 'hx-post="/surveys/validate/nhs-number/"' in content
-        assert 'hx-trigger="blur, keyup changed delay:500ms"' in content
-        assert 'hx-target="closest label"' in content
-        assert 'hx-swap="outerHTML"' in content
-
-    def test_valid_nhs_number_shows_checkmark(self, client, db):
-        """Test that a valid NHS number shows a checkmark icon."""
-        response = client.post(
-            "/surveys/validate/nhs-number/",
+            NHS_NUMBER_URL,
             {"nhs_number": "4505577104"},
         )
         assert response.status_code == 200
-        content = response.content.decode()
-        assert "text-success" in content
-        assert "polyline" in content  # Checkmark SVG
-
-    def test_invalid_nhs_number_shows_x_icon(self, client, db):
-        """Test that an invalid NHS number shows an X icon."""
-        response = client.post(
-            "/surveys/validate/nhs-number/",
-            {"nhs_number": "1234567890"},
-        )
-        assert response.status_code == 200
-        content = response.content.decode()
-        assert "text-error" in content
-        assert '<line x1="18"' in content  # X icon SVG
+        assert b'hx-post="/surveys/validate/nhs-number/"' in response.content
+        for attribute in HTMX_ATTRIBUTES:
+            assert attribute in response.content
 
     def test_get_request_not_allowed(self, client, db):
         """Test that GET requests are not allowed."""
-        response = client.get("/surveys/validate/nhs-number/")
+        response = client.get(NHS_NUMBER_URL)
         assert response.status_code == 405
 
 
+@pytest.fixture(scope="class")
+def configured_api():
+    """Point the view at a (mocked) postcode API for every test in the class."""
+    with override_settings(
+        POSTCODES_API_URL="https://api.example.com/postcodes/",
+        POSTCODES_API_KEY="test-key",
+    ):
+        yield
+
+
+@pytest.mark.usefixtures("configured_api")
 class TestPostcodeValidation:
     """Tests for the postcode HTMX validation endpoint."""
 
+    @pytest.fixture
+    def mock_get(self, monkeypatch):
+        """Replace requests.get, which the view calls to check the postcode."""
+        mock = MagicMock()
+        monkeypatch.setattr("requests.get", mock)
+        return mock
+
     def test_empty_postcode_returns_empty_input(self, client, db):
         """Test that an empty postcode returns a clean input."""
         response = client.post(
-            "/surveys/validate/postcode/",
+            POSTCODE_URL,
             {"post_code": ""},
         )
         assert response.status_code == 200
-        content = response.content.decode()
-        assert "input-success" not in content
-        assert "input-error" not in content
-        assert 'placeholder="Post code"' in content
+        assert b"input-success" not in response.content
+        assert b"input-error" not in response.content
+        assert b'placeholder="Post code"' in response.content
 
     @override_settings(POSTCODES_API_URL="", POSTCODES_API_KEY="")
     def test_api_not_configured_returns_neutral_styling(self, client, db):
         """Test that when API is not configured, no validation styling is shown."""
         response = client.post(
-            "/surveys/validate/postcode/",
+            POSTCODE_URL,
             {"post_code": "SW1A 1AA"},
         )
         assert response.status_code == 200
-        content = response.content.decode()
-        assert "input-success" not in content
-        assert "input-error" not in content
-        assert "SW1A 1AA" in content
+        assert b"input-success" not in response.content
+        assert b"input-error" not in response.content
+        assert b"SW1A 1AA" in response.content
 
-    @override_settings(
-        POSTCODES_API_URL="https://api.example.com/postcodes/",
-        POSTCODES_API_KEY="test-key",
-    )
-    @patch("requests.get")
-    def test_valid_postcode_returns_success(self, mock_get, client, db):
+    def test_valid_postcode_returns_success(self, client, db, mock_get):
         """Test that a valid postcode returns success styling."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"valid": True}
-        mock_get.return_value = mock_response
+        mock_get.return_value = _VALID
 
         response = client.post(
-            "/surveys/validate/postcode/",
+            POSTCODE_URL,
             {"post_code": "SW1A 1AA"},
         )
         assert response.status_code == 200
-        content = response.content.decode()
-        assert "input-success" in content
-        assert "SW1A 1AA" in content
+        assert b"input-success" in response.content
+        assert b"SW1A 1AA" in response.content
 
-    @override_settings(
-        POSTCODES_API_URL="https://api.example.com/postcodes/",
-        POSTCODES_API_KEY="test-key",
-    )
-    @patch("requests.get")
-    def test_invalid_postcode_returns_error(self, mock_get, client, db):
+    def test_invalid_postcode_returns_error(self, client, db, mock_get):
         """Test that an invalid postcode returns error styling."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"valid": False}
-        mock_get.return_value = mock_response
+        mock_get.return_value = _INVALID
 
         response = client.post(
-            "/surveys/validate/postcode/",
+            POSTCODE_URL,
             {"post_code": "INVALID"},
         )
         assert response.status_code == 200
-        content = response.content.decode()
-        assert "input-error" in content
+        assert b"input-error" in response.content
 
-    @override_settings(
-        POSTCODES_API_URL="https://api.example.com/postcodes/",
-        POSTCODES_API_KEY="test-key",
-    )
-    @patch("requests.get")
-    def test_api_error_returns_neutral_styling(self, mock_get, client, db):
+    def test_api_error_returns_neutral_styling(self, client, db, mock_get):
         """Test that API errors result in neutral styling (no validation shown)."""
         mock_get.side_effect = Exception("API error")
 
         response = client.post(
-            "/surveys/validate/postcode/",
+            POSTCODE_URL,
             {"post_code": "SW1A 1AA"},
         )
         assert response.status_code == 200
-        content = response.content.decode()
-        assert "input-success" not in content
-        assert "input-error" not in content
+        assert b"input-success" not in response.content
+        assert b"input-error" not in response.content
 
-    @override_settings(
-        POSTCODES_API_URL="https://api.example.com/postcodes/",
-        POSTCODES_API_KEY="test-key",
-    )
-    @patch("requests.get")
-    def test_postcode_is_uppercased(self, mock_get, client, db):
+    def test_postcode_is_uppercased(self, client, db, mock_get):
         """Test that postcodes are converted to uppercase."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"valid": True}
-        mock_get.return_value = mock_response
+        mock_get.return_value = _VALID
 
         response = client.post(
-            "/surveys/validate/postcode/",
+            POSTCODE_URL,
             {"post_code": "sw1a 1aa"},
         )
         assert response.status_code == 200
-        content = response.content.decode()
-        assert "SW1A 1AA" in content
+        assert b"SW1A 1AA" in response.content
 
-    @override_settings(
-        POSTCODES_API_URL="https://api.example.com/postcodes/",
-        POSTCODES_API_KEY="test-key",
-    )
-    @patch("requests.get")
-    def test_htmx_attributes_preserved_in_postcode_response(self, mock_get, client, db):
+    def test_htmx_attributes_preserved_in_postcode_response(self, client, db, mock_get):
         """Test that HTMX attributes are preserved in the postcode response."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"valid": True}
-        mock_get.return_value = mock_response
+        mock_get.return_value = _VALID
 
         response = client.post(
-            "/surveys/validate/postcode/",
+            POSTCODE_URL,
             {"post_code": "SW1A 1AA"},
         )
         assert response.status_code == 200
-        content = response.content.decode()
-        assert 'hx-post="/surveys/validate/postcode/"' in content
-        assert 'hx-trigger="blur, keyup changed delay:500ms"' in content
-        assert 'hx-target="closest label"' in content
-        assert 'hx-swap="outerHTML"' in content
+        assert b'hx-post="/surveys/validate/postcode/"' in response.content
+        for attribute in HTMX_ATTRIBUTES:
+            assert attribute in response.content
 
     def test_get_request_not_allowed(self, client, db):
         """Test that GET requests are not allowed."""
-        response = client.get("/surveys/validate/postcode/")
+        response = client.get(POSTCODE_URL)
         assert response.status_code == 405